@@ -18,14 +18,17 @@ from .protocols import *  # noqa
 from .streams import *  # noqa
 from .urls import *  # noqa
 
+# the asyncio api wraps the modules above
+from .aio import *  # noqa  # isort:skip
+
 
 import_tentaclio_plugins()
 
 # Stream handlers
 
 # Local files
-STREAM_HANDLER_REGISTRY.register("", StreamURLHandler(LocalFSClient))
-STREAM_HANDLER_REGISTRY.register("file", StreamURLHandler(LocalFSClient))
+STREAM_HANDLER_REGISTRY.register("", LocalStreamURLHandler(LocalFSClient))
+STREAM_HANDLER_REGISTRY.register("file", LocalStreamURLHandler(LocalFSClient))
 
 # ftp / sftp handlers
 STREAM_HANDLER_REGISTRY.register("ftp", StreamURLHandler(FTPClient))
@@ -49,3 +52,10 @@ REMOVER_REGISTRY.register("", ClientRemover(LocalFSClient))
 REMOVER_REGISTRY.register("file", ClientRemover(LocalFSClient))
 REMOVER_REGISTRY.register("ftp", ClientRemover(FTPClient))
 REMOVER_REGISTRY.register("sftp", ClientRemover(SFTPClient))
+
+# Copiers
+
+COPIER_REGISTRY.register("+", LocalCopier())
+COPIER_REGISTRY.register("file+file", LocalCopier())
+COPIER_REGISTRY.register("+file", LocalCopier())
+COPIER_REGISTRY.register("file+", LocalCopier())
@@ -0,0 +1,231 @@
+"""Asyncio entry points.
+
+None of the clients has an asyncio driver, so the blocking calls (connecting, loading readers,
+flushing writers, scanning directories...) run in a managed thread pool. The event loop stays
+free and one process can keep hundreds of transfers in flight.
+
+    >>> async with tentaclio.aopen("sftp://host/file.csv") as reader:
+    ...     contents = await reader.read()
+"""
+import asyncio
+import concurrent.futures
+import functools
+import os
+import threading
+from typing import Any, Callable, ClassVar, Generator, List, Optional, TypeVar
+
+from tentaclio.fs import api as fs_api
+from tentaclio.fs.scanner import DirEntry
+from tentaclio.streams import api as streams_api
+from tentaclio.streams import base_stream
+
+
+__all__ = [
+    "AIO_EXECUTOR",
+    "AsyncStreamerReader",
+    "AsyncStreamerWriter",
+    "aopen",
+    "ascandir",
+    "acopy",
+    "aremove",
+]
+
+T = TypeVar("T")
+
+MAX_WORKERS_ENV = "TENTACLIO__AIO_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 128
+
+
+class AsyncExecutor:
+    """Thread pool running the blocking calls of the asyncio api."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Create the executor, the pool is started on first use."""
+        self.max_workers = int(max_workers or os.getenv(MAX_WORKERS_ENV) or DEFAULT_MAX_WORKERS)
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def configure(self, max_workers: int) -> None:
+        """Change the maximum number of concurrent blocking calls.
+
+        The running pool, if any, finishes its calls in the background.
+        """
+        with self._lock:
+            self.max_workers = max_workers
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Wait for the running calls and stop the pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run func in the pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="tentaclio-aio"
+                )
+            return self._executor
+
+
+class _AsyncExecutorHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[AsyncExecutor] = AsyncExecutor()
+
+
+AIO_EXECUTOR = _AsyncExecutorHolder().instance
+
+
+class _AsyncStream:
+    """Base class for the asyncio wrappers of readers and writers."""
+
+    def __init__(self, stream: base_stream.StreamBaseIO):
+        self.stream = stream
+
+    async def __aenter__(self):
+        """Return the stream, it'll be closed when leaving the context."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the stream."""
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Tell if the stream is closed."""
+        return self.stream.closed
+
+    async def seek(self, *args, **kwargs) -> int:
+        """Change the stream position to the given byte offset."""
+        return await AIO_EXECUTOR.run(self.stream.seek, *args, **kwargs)
+
+    async def tell(self) -> int:
+        """Return the current stream position."""
+        return self.stream.tell()
+
+    async def close(self) -> None:
+        """Close the stream, releasing the connection or uploading the contents."""
+        await AIO_EXECUTOR.run(self.stream.close)
+
+
+class AsyncStreamerReader(_AsyncStream):
+    """Asyncio reader, the reads run in the executor as they may hit the network."""
+
+    stream: base_stream.StreamerReader
+
+    def __aiter__(self):
+        """Return the reader as an async iterable of lines."""
+        return self
+
+    async def __anext__(self):
+        """Return the next line."""
+        line = await self.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line
+
+    async def read(self, size: int = -1) -> Any:
+        """Read up to size bytes or characters, all of them by default."""
+        return await AIO_EXECUTOR.run(self.stream.read, size)
+
+    async def readline(self, size: int = -1) -> Any:
+        """Read and return one line."""
+        return await AIO_EXECUTOR.run(self.stream.readline, size)
+
+    async def readlines(self, hint: int = -1) -> List:
+        """Read and return a list of lines."""
+        return await AIO_EXECUTOR.run(self.stream.readlines, hint)
+
+
+class AsyncStreamerWriter(_AsyncStream):
+    """Asyncio writer, the writes run in the executor as streaming writers may block."""
+
+    stream: base_stream.StreamerWriter
+
+    async def write(self, contents: Any) -> int:
+        """Write the contents."""
+        return await AIO_EXECUTOR.run(self.stream.write, contents)
+
+    async def writelines(self, lines: List[Any]) -> None:
+        """Write the lines."""
+        await AIO_EXECUTOR.run(self.stream.writelines, lines)
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the writer, discarding the contents if the block raised."""
+        if exc_type is not None:
+            await self.discard()
+        else:
+            await self.close()
+
+    async def discard(self) -> None:
+        """Close the writer after a failure, see `StreamerWriter.discard`."""
+        await AIO_EXECUTOR.run(self.stream.discard)
+
+
+class _AsyncStreamOpener:
+    """Awaitable that can also be used as an async context manager, like the builtin open."""
+
+    def __init__(self, url: str, mode: Optional[str], kwargs: dict):
+        self.url = url
+        self.mode = mode
+        self.kwargs = kwargs
+        self.stream: Optional[_AsyncStream] = None
+
+    def __await__(self) -> Generator[Any, None, _AsyncStream]:
+        return self._open().__await__()
+
+    async def __aenter__(self) -> Any:
+        self.stream = await self._open()
+        return self.stream
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        assert self.stream is not None
+        await self.stream.__aexit__(exc_type, exc_value, traceback)
+
+    async def _open(self) -> _AsyncStream:
+        context = await AIO_EXECUTOR.run(streams_api.open, self.url, self.mode, **self.kwargs)
+        stream = context.__enter__()
+        if isinstance(stream, base_stream.StreamerWriter):
+            return AsyncStreamerWriter(stream)
+        return AsyncStreamerReader(stream)
+
+
+def aopen(url: str, mode: Optional[str] = None, **kwargs) -> _AsyncStreamOpener:
+    """Open a url returning an asyncio reader or writer depending on mode.
+
+    The arguments are the same as `tentaclio.open`. The result can be awaited or used as
+    an async context manager.
+
+    Examples:
+        >>> async with aopen(path, "wb") as writer:
+        ...     await writer.write(contents)
+        >>> reader = await aopen(path, "rb")
+    """
+    return _AsyncStreamOpener(url, mode, kwargs)
+
+
+async def ascandir(url: str) -> List[DirEntry]:
+    """Scan a directory-like url returning the list of its entries."""
+    return await AIO_EXECUTOR.run(lambda: list(fs_api.scandir(url)))
+
+
+async def acopy(source: str, dest: str) -> None:
+    """Copy the contents of the origin url into the dest url."""
+    await AIO_EXECUTOR.run(fs_api.copy, source, dest)
+
+
+async def aremove(url: str) -> None:
+    """Delete the resource identified by the url."""
+    await AIO_EXECUTOR.run(fs_api.remove, url)
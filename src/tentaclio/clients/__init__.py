@@ -7,7 +7,10 @@ Query based clients unify how to access databases leveraging from sqlalchemy.
 """
 from .base_client import *  # noqa
 from .ftp_client import *  # noqa
+from .http_cache import *  # noqa
+from .http_hedging import *  # noqa
 from .http_client import *  # noqa
 from .importer import *  # noqa
 from .local_fs_client import *  # noqa
+from .pool import *  # noqa
 from .sqla_client import *  # noqa
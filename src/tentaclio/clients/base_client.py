@@ -7,6 +7,9 @@ from tentaclio import protocols, urls
 
 T = TypeVar("T")
 
+# Size of the blocks clients move around when streaming contents.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseClient(ContextManager[T], metaclass=abc.ABCMeta):
     """Abstract base class for clients, wrapping a connection.
@@ -1,22 +1,42 @@
 """FTP ans SFTP stream clients."""
+import collections
+import concurrent.futures
 import ftplib
-import io
+import functools
 import logging
 import os
+import socket
 import stat
-from typing import Iterable, Optional, Union
+import threading
+from typing import IO, Callable, ClassVar, Deque, Dict, Hashable, Iterable, Iterator, List
+from typing import Optional, Union, cast
 
-from paramiko import DSSKey, ECDSAKey, Ed25519Key, PKey, RSAKey, sftp_client
+from paramiko import DSSKey, ECDSAKey, Ed25519Key, PKey, RSAKey, SSHException, sftp_client
+from paramiko import sftp_file
 from paramiko.transport import Transport
 
 from tentaclio import fs, protocols, urls
 
-from . import base_client, decorators, exceptions
+from . import base_client, decorators, exceptions, pool, resume
 
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["FTPClient", "SFTPClient"]
+__all__ = ["FTPClient", "SFTPClient", "SSH_TRANSPORTS"]
+
+# seconds between keepalive packets of ssh transports
+SSH_KEEPALIVE_INTERVAL = 30
+# sessions per connection accepted by default by openssh (MaxSessions)
+DEFAULT_MAX_CHANNELS = 10
+
+SHARED_TRANSPORT_ENV = "TENTACLIO__SFTP_SHARED_TRANSPORT"
+
+# bytes fetched per request of segmented ftp downloads
+DEFAULT_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# errors of a dropped connection, the transfers interrupted by them can be resumed
+FTP_TRANSFER_ERRORS = (OSError, EOFError, ftplib.error_temp)
+SFTP_TRANSFER_ERRORS = (SSHException, EOFError, ConnectionError, socket.timeout)
 
 
 class FTPClient(base_client.BaseClient["FTPClient"]):
@@ -26,54 +46,320 @@ class FTPClient(base_client.BaseClient["FTPClient"]):
 
     conn: ftplib.FTP
 
-    def __init__(self, url: Union[str, urls.URL], **kwargs) -> None:
-        """Create a new ftp client based on the url starting with ftp://."""
+    def __init__(
+        self,
+        url: Union[str, urls.URL],
+        segments: Optional[int] = None,
+        segment_size: Optional[int] = None,
+        block_size: Optional[int] = None,
+        append: Optional[bool] = None,
+        retries: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """Create a new ftp client based on the url starting with ftp://.
+
+        With more than one segment, downloads are split in ranges of segment_size bytes
+        fetched over that many parallel connections. Uploads send block_size bytes of the
+        reader at a time, and are added to the end of the remote file with append.
+        Transfers interrupted by a dropped connection are resumed up to retries times.
+        These settings can also be passed in the url query.
+        """
         super().__init__(url)
         self.port = self.url.port or 21
+        query = self.url.query or {}
+        self.segments = int(segments or query.get("segments") or 1)
+        self.segment_size = int(segment_size or query.get("segment_size") or DEFAULT_SEGMENT_SIZE)
+        self.block_size = int(
+            block_size or query.get("block_size") or base_client.DEFAULT_CHUNK_SIZE
+        )
+        if append is None:
+            append = _is_true(query.get("append", "false"))
+        self.append = append
+        self.retries = resume.retry_budget(retries, query)
+        self._pooled = False
+        self._reusable = True
 
     # Connection methods:
 
+    def __exit__(self, exc_type, *args) -> None:
+        """Close the connection, it's only pooled if the context exited cleanly."""
+        if exc_type is not None:
+            self._reusable = False
+        super().__exit__(exc_type, *args)
+
     def _connect(self) -> ftplib.FTP:
-        logging.info(f"starting ftp connection to {self.url}")
-        conn = ftplib.FTP()
-        conn.connect(self.url.hostname or "", port=self.port)
-        conn.login(user=self.url.username or "", passwd=self.url.password or "")
+        self._reusable = True
+        conn = pool.CONNECTION_POOL.acquire(self._pool_key(), _ftp_is_alive)
+        if conn is None:
+            logging.info(f"starting ftp connection to {self.url}")
+            conn = ftplib.FTP()
+            conn.connect(self.url.hostname or "", port=self.port)
+            conn.login(user=self.url.username or "", passwd=self.url.password or "")
+        self._pooled = True
         return conn
 
+    def close(self) -> None:
+        """Give the connection back to the pool, or close it if it can't be reused."""
+        if self.closed or not self._pooled:
+            return super().close()
+        self.closed = True
+        self._pooled = False
+        if self._reusable:
+            pool.CONNECTION_POOL.release(self._pool_key(), self.conn, _ftp_quit)
+        else:
+            _ftp_quit(self.conn)
+
+    def _pool_key(self) -> tuple:
+        return ("ftp", self.url.hostname, self.port, self.url.username, self.url.password)
+
+    def _reconnect(self) -> None:
+        # the dropped connection can't be reused
+        _ftp_quit(self.conn)
+        self.conn = self._connect()
+
     # Stream methods:
 
     @decorators.check_conn
     def get(self, writer: protocols.ByteWriter, file_path: Optional[str] = None) -> None:
         """Write the contents of a remote file into the passed writer.
 
+        Files bigger than a segment are downloaded in parallel segments when the client
+        has more than one, as long as the server supports SIZE and REST.
+
+        Arguments:
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        if self.segments > 1:
+            size = self._segmentable_size(remote_path)
+            if size is not None:
+                return self._get_segments(writer, remote_path, size)
+
+        counter = resume.CountingWriter(writer)
+
+        def transfer():
+            # REST makes the server send the file from the bytes already received
+            self.conn.retrbinary(f"RETR {remote_path}", counter.write, rest=counter.offset or None)
+
+        try:
+            resume.retry_transfer(
+                transfer,
+                self.retries,
+                FTP_TRANSFER_ERRORS,
+                self._reconnect,
+                f"ftp download of {remote_path}",
+            )
+        except Exception as e:
+            raise exceptions.FTPError("Error from ftp server:" + str(e))
+
+    @decorators.check_conn
+    def iter_chunks(
+        self, chunk_size: int = base_client.DEFAULT_CHUNK_SIZE, file_path: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """Yield the contents of a remote file as they arrive from the server.
+
+        This is the pull based version of `get` (`retrbinary` drives the same RETR command
+        pushing blocks into a callback), the connection needs to be open while iterating.
+
+        Arguments:
+            :chunk_size: Maximum size of the yielded chunks.
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        try:
+            self.conn.voidcmd("TYPE I")
+            data_conn = self.conn.transfercmd(f"RETR {remote_path}")
+        except Exception as e:
+            raise exceptions.FTPError("Error from ftp server:" + str(e))
+
+        # a transfer abandoned halfway leaves the control connection out of sync
+        self._reusable = False
+        with data_conn:
+            while True:
+                chunk = data_conn.recv(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        self.conn.voidresp()
+        self._reusable = True
+
+    @decorators.check_conn
+    def get_size(self, file_path: Optional[str] = None) -> int:
+        """Return the size of the remote file using the SIZE command.
+
+        Arguments:
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        try:
+            # SIZE is only reliable in binary mode
+            self.conn.voidcmd("TYPE I")
+            size = self.conn.size(remote_path)
+        except Exception as e:
+            raise exceptions.FTPError("Error from ftp server:" + str(e))
+        if size is None:
+            raise exceptions.FTPError(f"Unable to find the size of {remote_path}")
+        return size
+
+    @decorators.check_conn
+    def get_fingerprint(self, file_path: Optional[str] = None) -> Optional[str]:
+        """Return the size and modification time of the remote file.
+
+        None is returned if the server doesn't implement MDTM.
+
         Arguments:
             :file_path: The path of the remote file if not passed
                 in the costructor as part of the url.
         """
         remote_path = file_path or self.url.path
+        size = self.get_size(remote_path)
+        try:
+            # 213 YYYYMMDDHHMMSS
+            modified = self.conn.sendcmd(f"MDTM {remote_path}").split()[-1]
+        except ftplib.error_perm:
+            return None
+        return f"{size}-{modified}"
+
+    @decorators.check_conn
+    def get_range(self, offset: int, length: int, file_path: Optional[str] = None) -> bytes:
+        """Return length bytes of the remote file starting at offset.
+
+        The transfer is started at offset using REST and interrupted once length bytes are read.
+
+        Arguments:
+            :offset: Position of the first byte.
+            :length: Number of bytes to read.
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
         if remote_path == "":
             raise exceptions.FTPError("Missing remote file path")
 
         try:
-            self.conn.retrbinary(f"RETR {remote_path}", writer.write)
+            self.conn.voidcmd("TYPE I")
+            data_conn = self.conn.transfercmd(f"RETR {remote_path}", rest=offset)
         except Exception as e:
             raise exceptions.FTPError("Error from ftp server:" + str(e))
 
+        data = bytearray()
+        with data_conn:
+            while len(data) < length:
+                chunk = data_conn.recv(min(length - len(data), base_client.DEFAULT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                data += chunk
+
+        try:
+            self.conn.voidresp()
+        except ftplib.error_temp:
+            # 426, the transfer was closed before the end of the file
+            pass
+        return bytes(data)
+
     @decorators.check_conn
     def put(self, reader: protocols.ByteReader, file_path: Optional[str] = None) -> None:
         """Write the contents of the reader into the remote file.
 
+        The reader is consumed block by block, the contents are appended to the remote
+        file with APPE instead of replacing it with STOR if the client appends.
+
+        Uploads from seekable readers are resumed after a dropped connection, appending
+        the contents following the size of the partial remote file.
+
         Arguments:
             :file_path: The path of the remote file if not passed
                 in the costructor as part of the url.
         """
         remote_path = file_path or self.url.path
-        # storebinary only works with io.BytesIO
-        buff = io.BytesIO(bytearray(reader.read()))
-        self.conn.storbinary(f"STOR {remote_path}", buff)
+        command = "APPE" if self.append else "STOR"
+        seekable = resume.seekable_reader(reader)
+        if not self.retries or seekable is None:
+            self.conn.storbinary(f"{command} {remote_path}", reader, blocksize=self.block_size)
+            return
+
+        start = seekable.tell()
+        initial_size = self._remote_size(remote_path) if self.append else 0
+
+        def transfer():
+            self.conn.storbinary(f"{command} {remote_path}", seekable, blocksize=self.block_size)
+
+        def recover():
+            nonlocal command
+            self._reconnect()
+            seekable.seek(start + self._remote_size(remote_path) - initial_size)
+            command = "APPE"
+
+        resume.retry_transfer(
+            transfer, self.retries, FTP_TRANSFER_ERRORS, recover, f"ftp upload to {remote_path}"
+        )
 
     # Helpers:
 
+    def _remote_size(self, remote_path: str) -> int:
+        # files that don't exist yet are empty
+        try:
+            return self.get_size(remote_path)
+        except exceptions.FTPError:
+            return 0
+
+    def _segmentable_size(self, remote_path: str) -> Optional[int]:
+        # None when the file is too small or the server can't restart transfers
+        try:
+            size = self.get_size(remote_path)
+        except exceptions.FTPError:
+            logger.info(f"size of {remote_path} unknown, downloading it in a single stream")
+            return None
+        if size <= self.segment_size:
+            return None
+        try:
+            self.conn.sendcmd("REST 0")
+        except ftplib.error_perm:
+            logger.info(f"{self.url.hostname} lacks REST, downloading in a single stream")
+            return None
+        return size
+
+    def _get_segments(self, writer: protocols.ByteWriter, remote_path: str, size: int) -> None:
+        # segments are written in order, so at most one per connection is held in memory
+        executor = concurrent.futures.ThreadPoolExecutor(
+            self.segments, thread_name_prefix="tentaclio-ftp"
+        )
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        try:
+            for offset in range(0, size, self.segment_size):
+                length = min(self.segment_size, size - offset)
+                pending.append(
+                    executor.submit(self._get_segment, remote_path, offset, length)
+                )
+                if len(pending) >= self.segments:
+                    writer.write(pending.popleft().result())
+            while pending:
+                writer.write(pending.popleft().result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_segment(self, remote_path: str, offset: int, length: int) -> bytes:
+        # every segment uses its own connection, taken from the pool if possible
+        with FTPClient(self.url) as client:
+            data = client.get_range(offset, length, remote_path)
+        if len(data) != length:
+            raise exceptions.FTPError(
+                f"Segment at {offset} of {remote_path} is incomplete, the file may have changed"
+            )
+        return data
+
     def _scan_mlds(self, base_url):
         entries = []
         for mlsd_entry in self.conn.mlsd(self.url.path, facts=["type"]):
@@ -131,6 +417,18 @@ class FTPClient(base_client.BaseClient["FTPClient"]):
         self.conn.delete(self.url.path)
 
 
+def _ftp_is_alive(conn: ftplib.FTP) -> bool:
+    conn.voidcmd("NOOP")
+    return True
+
+
+def _ftp_quit(conn: ftplib.FTP) -> None:
+    try:
+        conn.quit()
+    except Exception:
+        conn.close()
+
+
 class SFTPClient(base_client.BaseClient["SFTPClient"]):
     """SFTP stream client."""
 
@@ -148,9 +446,24 @@ class SFTPClient(base_client.BaseClient["SFTPClient"]):
         url: Union[str, urls.URL],
         private_key_path: Optional[str] = None,
         private_key_password: Optional[str] = None,
+        shared_transport: Optional[bool] = None,
+        block_size: Optional[int] = None,
+        prefetch_concurrency: Optional[int] = None,
+        pipelined: Optional[bool] = None,
+        retries: Optional[int] = None,
         **kwargs,
     ) -> None:
-        """Create a new sftp client based on the url starting with sftp://."""
+        """Create a new sftp client based on the url starting with sftp://.
+
+        With shared_transport the sftp session is opened as a channel of an ssh connection
+        shared with the other clients of the same server and user.
+
+        Transfers are pipelined: downloads request the blocks ahead of time, at most
+        prefetch_concurrency at once (unlimited by default), and uploads send block_size
+        bytes of the reader at a time without waiting for each write to be acknowledged
+        unless pipelined is False. Transfers interrupted by a dropped connection are resumed
+        up to retries times. These settings can also be passed in the url query.
+        """
         super().__init__(url)
         self.username = self.url.username or ""
         self.password = self.url.password or ""
@@ -159,6 +472,24 @@ class SFTPClient(base_client.BaseClient["SFTPClient"]):
             "private_key_path") if self.url.query else None)
         self.private_key_password = private_key_password or (self.url.query.get(
             "private_key_password") if self.url.query else None)
+        query = self.url.query or {}
+        if shared_transport is None:
+            shared_transport = _is_true(
+                query.get("shared_transport", os.getenv(SHARED_TRANSPORT_ENV, ""))
+            )
+        self.shared_transport = shared_transport
+        self.block_size = int(
+            block_size or query.get("block_size") or base_client.DEFAULT_CHUNK_SIZE
+        )
+        concurrency = prefetch_concurrency or query.get("prefetch_concurrency")
+        self.prefetch_concurrency = int(concurrency) if concurrency else None
+        if pipelined is None:
+            pipelined = _is_true(query.get("pipelined", "true"))
+        self.pipelined = pipelined
+        self.retries = resume.retry_budget(retries, query)
+        self._range_files: Dict[str, sftp_file.SFTPFile] = {}
+        self._pooled = False
+        self._reusable = True
 
     def _get_private_key(self) -> PKey:
         if not self.private_key_path:
@@ -185,18 +516,68 @@ class SFTPClient(base_client.BaseClient["SFTPClient"]):
 
     # Connection methods:
 
+    def __exit__(self, exc_type, *args) -> None:
+        """Close the connection, it's only pooled if the context exited cleanly."""
+        if exc_type is not None:
+            self._reusable = False
+        super().__exit__(exc_type, *args)
+
     def _connect(self) -> sftp_client.SFTPClient:
         if self.url.hostname is None:
             raise exceptions.FTPError("Missing hostname in url")
-        transport = Transport((self.url.hostname, self.port))
+        self._reusable = True
+        client = pool.CONNECTION_POOL.acquire(self._pool_key(), _sftp_is_alive)
+        if client is None:
+            if self.shared_transport:
+                transport = SSH_TRANSPORTS.acquire(self._transport_key(), self._open_transport)
+            else:
+                transport = self._open_transport()
+
+            try:
+                client = sftp_client.SFTPClient.from_transport(transport)
+            except Exception:
+                self._close_connection_transport(transport)
+                raise
+            if not client:
+                self._close_connection_transport(transport)
+                raise exceptions.FTPError("Unable to connect to the server")
+        self._pooled = True
+        return client
+
+    def _open_transport(self) -> Transport:
+        transport = Transport((self.url.hostname or "", self.port))
         transport.start_client()
         self._authenticate(transport)
+        # keep the session alive while it waits in the pool
+        transport.set_keepalive(SSH_KEEPALIVE_INTERVAL)
+        return transport
+
+    def _close_connection(self, conn: sftp_client.SFTPClient) -> None:
+        if self.shared_transport:
+            _sftp_close_channel(conn)
+        else:
+            _sftp_close(conn)
 
-        client = sftp_client.SFTPClient.from_transport(transport)
-        if not client:
-            raise exceptions.FTPError("Unable to connect to the server")
+    def _close_connection_transport(self, transport: Transport) -> None:
+        if self.shared_transport:
+            SSH_TRANSPORTS.release(transport)
         else:
-            return client
+            transport.close()
+
+    def _transport_key(self) -> tuple:
+        return (self.url.hostname, self.port, self.username, self.password, self.private_key_path)
+
+    def _pool_key(self) -> tuple:
+        return ("sftp", *self._transport_key(), self.shared_transport)
+
+    def _reconnect(self) -> None:
+        # the dropped connection can't be reused
+        self._range_files.clear()
+        try:
+            self._close_connection(self.conn)
+        except Exception as e:
+            logger.debug(f"error closing dropped sftp connection: {e}")
+        self.conn = self._connect()
 
     # Stream methods:
 
@@ -216,11 +597,136 @@ class SFTPClient(base_client.BaseClient["SFTPClient"]):
             raise exceptions.FTPError("Unable to fetch the remote file")
 
         logger.info(f"sftp reading from {remote_path}")
+        counter = resume.CountingWriter(writer)
+
+        def transfer():
+            if not counter.offset:
+                self.conn.getfo(
+                    remote_path,
+                    cast(IO[bytes], counter),
+                    max_concurrent_prefetch_requests=self.prefetch_concurrency,
+                )
+                return
+            # continue from the bytes already received
+            with self.conn.open(remote_path, mode="rb") as f:
+                f.seek(counter.offset)
+                f.prefetch(max_concurrent_requests=self.prefetch_concurrency)
+                for chunk in iter(functools.partial(f.read, self.block_size), b""):
+                    counter.write(chunk)
+
+        resume.retry_transfer(
+            transfer,
+            self.retries,
+            SFTP_TRANSFER_ERRORS,
+            self._reconnect,
+            f"sftp download of {remote_path}",
+        )
 
-        if not isinstance(writer, io.BytesIO):
-            raise exceptions.FTPError("Writer is not a BytesIO object")
+    @decorators.check_conn
+    def iter_chunks(
+        self, chunk_size: int = base_client.DEFAULT_CHUNK_SIZE, file_path: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """Yield the contents of a remote file in chunks of at most chunk_size bytes.
+
+        The connection needs to be open while iterating.
+
+        Arguments:
+            :chunk_size: Maximum size of the yielded chunks.
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        if not self.isfile(remote_path):
+            raise exceptions.FTPError("Unable to fetch the remote file")
+
+        logger.info(f"sftp streaming from {remote_path}")
+        with self.conn.open(remote_path, mode="rb") as f:
+            size = f.stat().st_size or 0
+            for offset in range(0, size, chunk_size):
+                length = min(chunk_size, size - offset)
+                # the chunk is fetched with concurrent requests rather than a round trip per
+                # block, memory stays bounded as only one chunk is requested at a time
+                yield b"".join(f.readv([(offset, length)], self.prefetch_concurrency))
+
+    @decorators.check_conn
+    def get_size(self, file_path: Optional[str] = None) -> int:
+        """Return the size of the remote file.
+
+        Arguments:
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        try:
+            size = self.conn.stat(remote_path).st_size
+        except IOError as e:
+            raise exceptions.FTPError(f"Unable to stat {remote_path}: {e}")
+        if size is None:
+            raise exceptions.FTPError(f"Unable to find the size of {remote_path}")
+        return size
+
+    @decorators.check_conn
+    def get_fingerprint(self, file_path: Optional[str] = None) -> Optional[str]:
+        """Return the size and modification time of the remote file.
+
+        Arguments:
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        try:
+            attrs = self.conn.stat(remote_path)
+        except IOError as e:
+            raise exceptions.FTPError(f"Unable to stat {remote_path}: {e}")
+        return f"{attrs.st_size}-{attrs.st_mtime}"
+
+    @decorators.check_conn
+    def get_range(self, offset: int, length: int, file_path: Optional[str] = None) -> bytes:
+        """Return length bytes of the remote file starting at offset.
+
+        The remote file handle is kept open between calls until the client is closed.
+
+        Arguments:
+            :offset: Position of the first byte.
+            :length: Number of bytes to read.
+            :file_path: The path of the remote file if not passed
+                in the costructor as part of the url.
+        """
+        remote_path = file_path or self.url.path
+        if remote_path == "":
+            raise exceptions.FTPError("Missing remote file path")
+
+        if remote_path not in self._range_files:
+            self._range_files[remote_path] = self.conn.open(remote_path, mode="rb")
+        remote_file = self._range_files[remote_path]
+        remote_file.seek(offset)
+        return remote_file.read(length)
+
+    def close(self) -> None:
+        """Close the open remote files and give the connection back to the pool.
+
+        The connection is closed instead if it can't be reused.
+        """
+        for remote_file in self._range_files.values():
+            remote_file.close()
+        self._range_files.clear()
+        if self.closed or not self._pooled:
+            return super().close()
+        self.closed = True
+        self._pooled = False
+        if self._reusable:
+            pool.CONNECTION_POOL.release(self._pool_key(), self.conn, self._close_connection)
         else:
-            self.conn.getfo(remote_path, writer)
+            self._close_connection(self.conn)
 
     @decorators.check_conn
     def put(self, reader: protocols.ByteReader, file_path: Optional[str] = None) -> None:
@@ -235,11 +741,42 @@ class SFTPClient(base_client.BaseClient["SFTPClient"]):
             raise exceptions.FTPError("Missing remote file path")
 
         logger.info(f"sftp writing to {remote_path}")
+        seekable = resume.seekable_reader(reader)
+        if not self.retries or seekable is None:
+            self._write(reader, remote_path)
+            return
+
+        start = seekable.tell()
+        offset = 0
+
+        def recover():
+            nonlocal offset
+            self._reconnect()
+            try:
+                offset = self.conn.stat(remote_path).st_size or 0
+            except FileNotFoundError:
+                offset = 0
+            seekable.seek(start + offset)
+
+        resume.retry_transfer(
+            lambda: self._write(seekable, remote_path, offset),
+            self.retries,
+            SFTP_TRANSFER_ERRORS,
+            recover,
+            f"sftp upload to {remote_path}",
+        )
+
+    def _write(self, reader: protocols.ByteReader, remote_path: str, offset: int = 0) -> None:
         # this gives permission error
         # self.conn.putfo(remote_path, file_obj.read())
         # but open works
-        with self.conn.open(remote_path, mode="wb") as f:
-            f.write(reader.read())
+        # resumed uploads keep the contents before offset
+        with self.conn.open(remote_path, mode="r+b" if offset else "wb") as f:
+            f.seek(offset)
+            # the write errors are raised when the file is closed
+            f.set_pipelined(self.pipelined)
+            for chunk in iter(functools.partial(reader.read, self.block_size), b""):
+                f.write(chunk)
 
     def scandir(self, **kwargs) -> Iterable[fs.DirEntry]:
         """Scan the connection url to create dir entries."""
@@ -300,3 +837,100 @@ class SFTPClient(base_client.BaseClient["SFTPClient"]):
     def remove(self):
         """Remove the file from the ftp."""
         self.conn.remove(self.url.path)
+
+
+def _sftp_is_alive(conn: sftp_client.SFTPClient) -> bool:
+    channel = conn.get_channel()
+    if channel is None or channel.closed:
+        return False
+    transport = channel.get_transport()
+    if not transport.is_active():
+        return False
+    # fails if the server dropped the connection
+    transport.send_ignore()
+    return True
+
+
+def _sftp_close(conn: sftp_client.SFTPClient) -> None:
+    channel = conn.get_channel()
+    conn.close()
+    # the transport was created for this connection
+    if channel is not None:
+        channel.get_transport().close()
+
+
+def _sftp_close_channel(conn: sftp_client.SFTPClient) -> None:
+    channel = conn.get_channel()
+    conn.close()
+    # other clients may be using the transport
+    if channel is not None:
+        SSH_TRANSPORTS.release(channel.get_transport())
+
+
+def _is_true(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+class SSHTransportRegistry:
+    """Authenticated ssh connections shared by the sftp clients of the same server and user.
+
+    Each sftp client opens its session as a new channel of a shared transport, rather than
+    paying a full key exchange and authentication per client. Once a transport carries
+    max_channels sessions, the next client opens a new one. Transports are closed when their
+    last channel is released.
+    """
+
+    def __init__(self, max_channels: int = DEFAULT_MAX_CHANNELS):
+        """Create an empty registry."""
+        self.max_channels = max_channels
+        # transport and the number of channels using it
+        self._transports: Dict[Hashable, List[List]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, open_transport: Callable[[], Transport]) -> Transport:
+        """Return a transport with a free channel for the key, opening one if needed."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # concurrent clients wait for a single handshake instead of starting their own
+        with key_lock:
+            with self._lock:
+                entries = self._transports.setdefault(key, [])
+                entries[:] = [entry for entry in entries if entry[0].is_active()]
+                for entry in entries:
+                    if entry[1] < self.max_channels:
+                        entry[1] += 1
+                        return entry[0]
+
+            transport = open_transport()
+            with self._lock:
+                self._transports.setdefault(key, []).append([transport, 1])
+            return transport
+
+    def release(self, transport: Transport) -> None:
+        """Release a channel of the transport, closing it if it was the last one."""
+        with self._lock:
+            for entries in self._transports.values():
+                for entry in entries:
+                    if entry[0] is transport:
+                        entry[1] -= 1
+                        if entry[1] > 0:
+                            return
+                        entries.remove(entry)
+                        break
+        transport.close()
+
+    def size(self) -> int:
+        """Return the number of open transports."""
+        with self._lock:
+            return sum(len(entries) for entries in self._transports.values())
+
+
+class _SSHTransportRegistryHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[SSHTransportRegistry] = SSHTransportRegistry()
+
+
+SSH_TRANSPORTS = _SSHTransportRegistryHolder().instance
@@ -0,0 +1,89 @@
+"""On-disk cache of http responses revalidated with conditional requests.
+
+The body of a response is stored along with its validators (`ETag`, `Last-Modified`). The next
+request for the same url sends them back in `If-None-Match` / `If-Modified-Since` headers, and a
+`304 Not Modified` answer is served from disk without downloading the body again.
+
+The least recently used entries are evicted when the cache grows past its maximum size, see
+`DiskStore`.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import ClassVar, Iterable, Iterator, Optional
+
+from tentaclio import disk_store, protocols
+
+
+__all__ = ["HTTP_CACHE", "HTTPResponseCache"]
+
+HTTP_CACHE_DIR_ENV = "TENTACLIO__HTTP_CACHE_DIR"
+HTTP_CACHE_MAX_SIZE_ENV = "TENTACLIO__HTTP_CACHE_MAX_SIZE"
+
+DEFAULT_HTTP_CACHE_DIR = os.path.join("~", ".cache", "tentaclio", "http")
+DEFAULT_HTTP_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+
+def cache_key(url: str, username: Optional[str] = None) -> str:
+    """Return the key of the responses of a url, different users may get different contents."""
+    return hashlib.sha256(f"{username or ''}@{url}".encode("utf-8")).hexdigest()
+
+
+class HTTPResponseCache(disk_store.DiskStore):
+    """Bounded on-disk store of response bodies and their validators."""
+
+    def __init__(self, directory: Optional[str] = None, max_size: Optional[int] = None):
+        """Create a cache, the settings default to the environment or the module defaults."""
+        super().__init__(
+            directory or os.getenv(HTTP_CACHE_DIR_ENV) or DEFAULT_HTTP_CACHE_DIR,
+            int(max_size or os.getenv(HTTP_CACHE_MAX_SIZE_ENV) or DEFAULT_HTTP_CACHE_MAX_SIZE),
+        )
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """Return the validators of the cached response, None if there isn't one.
+
+        The result contains the `etag` and `last_modified` headers, if sent by the server,
+        and the `validated_at` timestamp of the last time the contents were known fresh.
+        """
+        try:
+            return json.loads(self.read_meta(key) or "")
+        except ValueError:
+            return None
+
+    def read_into(self, key: str, writer: protocols.ByteWriter) -> bool:
+        """Copy the cached body into the writer, False if it has been evicted."""
+        try:
+            f = open(self.data_path(key), "rb")
+        except FileNotFoundError:
+            return False
+        with f:
+            self.touch(key)
+            shutil.copyfileobj(f, writer)
+        return True
+
+    def refresh(self, key: str, meta: dict) -> None:
+        """Mark the cached response as fresh."""
+        self.write_meta(key, json.dumps({**meta, "validated_at": time.time()}))
+
+    def store(self, key: str, meta: dict, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Yield the chunks of the body while saving them, the entry is stored at the end.
+
+        A download interrupted before the last chunk leaves the previous entry untouched.
+        """
+        with self.write_data(key) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+        self.refresh(key, meta)
+        self.evict(keep=key)
+
+
+class _HTTPResponseCacheHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[HTTPResponseCache] = HTTPResponseCache()
+
+
+HTTP_CACHE = _HTTPResponseCacheHolder().instance
@@ -1,22 +1,51 @@
 """HTTP Stream client."""
-import io
-from typing import Optional, Union
+import atexit
+import functools
+import logging
+import os
+import threading
+import time
+import zlib
+from typing import ClassVar, Dict, Hashable, Iterator, Optional, Union
 from urllib import parse
 
 import requests
+from requests import adapters
+from urllib3.util import request as urllib3_request
 
 from tentaclio import protocols
 
-from . import base_client, decorators, exceptions
+from . import base_client, decorators, exceptions, http_cache, http_hedging, resume
 
 
-__all__ = ["HTTPClient"]
+logger = logging.getLogger(__name__)
+
+__all__ = ["HTTPClient", "HTTP_SESSIONS"]
 
 
 DEFAULT_TIMEOUT = 10.0
 
 DEFAULT_HEADERS = {"Accept": "application/json"}
 
+UPLOAD_METHODS = ("POST", "PUT")
+
+# every content coding urllib3 can decode, requests only sends gzip and deflate by default
+# while br and zstd depend on the brotli and zstandard packages
+ACCEPT_ENCODING = getattr(urllib3_request, "ACCEPT_ENCODING", "gzip,deflate")
+
+# sizes and byte ranges refer to the encoded body, they are only meaningful for the raw bytes
+IDENTITY_ENCODING = {"Accept-Encoding": "identity"}
+
+# errors of a dropped connection, the downloads interrupted by them can be resumed
+HTTP_TRANSFER_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
+POOL_CONNECTIONS_ENV = "TENTACLIO__HTTP_POOL_CONNECTIONS"
+POOL_MAXSIZE_ENV = "TENTACLIO__HTTP_POOL_MAXSIZE"
+
 
 class HTTPClient(base_client.BaseClient["HTTPClient"]):
     """HTTP stream client.
@@ -42,12 +71,59 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
         url: str,
         default_timeout: Optional[float] = None,
         default_headers: Optional[dict] = None,
+        block_size: Optional[int] = None,
+        upload_method: str = "POST",
+        keep_alive: bool = True,
+        http_cache: bool = False,
+        cache_ttl: Optional[float] = None,
+        accept_encoding: bool = False,
+        compress_uploads: bool = False,
+        hedge: bool = False,
+        retries: Optional[int] = None,
     ) -> None:
-        """Create a new http/https client based on the passed url and extra params."""
+        """Create a new http/https client based on the passed url and extra params.
+
+        Downloads are written block_size bytes at a time as they arrive, uploads are
+        sent with upload_method, either POST or PUT.
+
+        With keep_alive the requests go through the session shared by the clients of the
+        same host and credentials, reusing its open connections. Otherwise the client
+        opens its own session and closes it with the client.
+
+        With http_cache the downloads are kept in the HTTP_CACHE and revalidated with
+        conditional requests, within cache_ttl seconds of the last validation they are
+        served without contacting the server.
+
+        Downloads are always decompressed as they are written. Requests negotiates gzip and
+        deflate by default, with accept_encoding the requests accept every compression the
+        client is able to decode, adding br and zstd when their packages are installed. With
+        compress_uploads the uploads are sent gzip compressed.
+
+        With hedge the downloads lacking a response after a high percentile of the latencies
+        of the host are sent again, following the HTTP_HEDGING policy.
+
+        Downloads interrupted by a dropped connection are resumed with a Range request
+        up to retries times, resumable downloads ask for the uncompressed body.
+        """
+        self.hedge = hedge
+        self.retries = resume.retry_budget(retries)
+        self.keep_alive = keep_alive
+        self.http_cache = http_cache
+        self.cache_ttl = cache_ttl
+        if upload_method not in UPLOAD_METHODS:
+            valid = ",".join(UPLOAD_METHODS)
+            raise ValueError(f"Upload method {upload_method} is not allowed. Valid are {valid}")
+        self.upload_method = upload_method
         # Default connection timeout at 10''
         self.timeout = default_timeout or DEFAULT_TIMEOUT
+        self.block_size = block_size or base_client.DEFAULT_CHUNK_SIZE
         # Default JSON response back
         self.headers = default_headers or DEFAULT_HEADERS
+        if accept_encoding:
+            self.headers = {**self.headers, "Accept-Encoding": ACCEPT_ENCODING}
+        self.compress_uploads = compress_uploads
+        # bodies of the urls whose server ignored a range request, fetched only once
+        self._unranged: Dict[str, bytes] = {}
         super().__init__(url)
 
         self.protocol = self.url.scheme
@@ -66,11 +142,14 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
     # Connection methods:
 
     def _connect(self) -> requests.Session:
+        if self.keep_alive:
+            # the default headers are sent with every request instead of set in the session
+            return HTTP_SESSIONS.get(self._session_key(), self._auth())
+
         session = requests.Session()
 
         # credentials provided
-        if self.username and self.password:
-            session.auth = (self.username, self.password)
+        session.auth = self._auth()
 
         # Non-empty header
         if self.headers:
@@ -78,6 +157,22 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
 
         return session
 
+    def close(self) -> None:
+        """Close the client, shared sessions are kept open for the next clients."""
+        self._unranged.clear()
+        if self.keep_alive:
+            self.closed = True
+            return
+        super().close()
+
+    def _auth(self) -> Optional[tuple]:
+        if self.username and self.password:
+            return (self.username, self.password)
+        return None
+
+    def _session_key(self) -> tuple:
+        return (self.protocol, self.hostname, self.port, self.username, self.password)
+
     # Stream methods:
 
     @decorators.check_conn
@@ -90,7 +185,58 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
     ) -> None:
         """Read the contents from the url and write them into the provided writer.
 
+        The body is streamed into the writer in blocks instead of being loaded in memory.
+
+        Arguments:
+            :end_point: Path to append to the url passed in the constructor.
+            :params: Url params to add
+            :options: More options for the request library.
+        """
+        url = self._fetch_url(endpoint or "")
+
+        if self.http_cache:
+            return self._get_cached(writer, url, params, options)
+
+        counter = resume.CountingWriter(writer)
+
+        def transfer():
+            offset = counter.offset
+            # the counter sees decoded bytes while ranges refer to the encoded ones
+            headers = {**IDENTITY_ENCODING} if self.retries else {}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            request = self._build_request(
+                "GET", url, default_params=params, default_headers=headers
+            )
+            response = self._send_get(request, options)
+
+            with response:
+                if offset and response.status_code == 206:
+                    _check_identity(url, response)
+                if offset and response.status_code != 206:
+                    logger.warning(f"{url} ignored the range, skipping {offset} bytes")
+                    chunks = _skip(response.iter_content(chunk_size=self.block_size), offset)
+                else:
+                    chunks = response.iter_content(chunk_size=self.block_size)
+                for chunk in chunks:
+                    counter.write(chunk)
+
+        resume.retry_transfer(
+            transfer, self.retries, HTTP_TRANSFER_ERRORS, lambda: None, f"download of {url}"
+        )
+
+    @decorators.check_conn
+    def iter_chunks(
+        self,
+        chunk_size: int = base_client.DEFAULT_CHUNK_SIZE,
+        endpoint: Optional[str] = None,
+        params: Optional[dict] = None,
+        options: Optional[dict] = None,
+    ) -> Iterator[bytes]:
+        """Yield the body of the response as it's downloaded.
+
         Arguments:
+            :chunk_size: Maximum size of the yielded chunks.
             :end_point: Path to append to the url passed in the constructor.
             :params: Url params to add
             :options: More options for the request library.
@@ -98,9 +244,102 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
         url = self._fetch_url(endpoint or "")
 
         request = self._build_request("GET", url, default_params=params)
+        response = self._send_request(request, default_options={**(options or {}), "stream": True})
+
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    @decorators.check_conn
+    def get_size(
+        self,
+        endpoint: Optional[str] = None,
+        params: Optional[dict] = None,
+        options: Optional[dict] = None,
+    ) -> int:
+        """Return the size of the resource as reported by a HEAD request.
+
+        Arguments:
+            :end_point: Path to append to the url passed in the constructor.
+            :params: Url params to add
+            :options: More options for the request library.
+        """
+        url = self._fetch_url(endpoint or "")
+
+        request = self._build_request(
+            "HEAD", url, default_params=params, default_headers=IDENTITY_ENCODING
+        )
+        response = self._send_request(request, default_options=options)
+        _check_identity(url, response)
+
+        if "Content-Length" not in response.headers:
+            raise exceptions.HTTPError(f"Unable to find the size of {url}")
+        return int(response.headers["Content-Length"])
+
+    @decorators.check_conn
+    def get_fingerprint(
+        self,
+        endpoint: Optional[str] = None,
+        params: Optional[dict] = None,
+        options: Optional[dict] = None,
+    ) -> Optional[str]:
+        """Return the validators (ETag, Last-Modified) of the resource using a HEAD request.
+
+        None is returned if the server doesn't send any of them.
+
+        Arguments:
+            :end_point: Path to append to the url passed in the constructor.
+            :params: Url params to add
+            :options: More options for the request library.
+        """
+        url = self._fetch_url(endpoint or "")
+
+        request = self._build_request(
+            "HEAD", url, default_params=params, default_headers=IDENTITY_ENCODING
+        )
         response = self._send_request(request, default_options=options)
 
-        writer.write(response.content)
+        validators = [response.headers.get(name) for name in ("ETag", "Last-Modified")]
+        if not any(validators):
+            return None
+        return "|".join(filter(None, [*validators, response.headers.get("Content-Length")]))
+
+    @decorators.check_conn
+    def get_range(
+        self,
+        offset: int,
+        length: int,
+        endpoint: Optional[str] = None,
+        params: Optional[dict] = None,
+        options: Optional[dict] = None,
+    ) -> bytes:
+        """Return length bytes of the resource starting at offset using a Range request.
+
+        If the server ignores the range the whole body is kept by the client, until it's
+        closed, to serve the next ranges without downloading it again.
+
+        Arguments:
+            :offset: Position of the first byte.
+            :length: Number of bytes to read.
+            :end_point: Path to append to the url passed in the constructor.
+            :params: Url params to add
+            :options: More options for the request library.
+        """
+        url = self._fetch_url(endpoint or "")
+        headers = {**IDENTITY_ENCODING, "Range": f"bytes={offset}-{offset + length - 1}"}
+
+        request = self._build_request(
+            "GET", url, default_params=params, default_headers=headers
+        )
+        body = self._unranged.get(request.url)
+        if body is None:
+            response = self._send_request(request, default_options=options)
+            _check_identity(url, response)
+            if response.status_code == 206:
+                return response.content
+            # the server ignored the range and sent the whole resource, keep it for the next ones
+            logger.warning(f"{url} doesn't support range requests, keeping it in memory")
+            body = self._unranged[request.url] = response.content
+        return body[offset:offset + length]
 
     @decorators.check_conn
     def put(
@@ -109,21 +348,100 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
         endpoint: Optional[str] = None,
         params: Optional[dict] = None,
         options: Optional[dict] = None,
+        method: Optional[str] = None,
     ) -> None:
-        """Write the contents of the provided reader into the url using POST.
+        """Write the contents of the provided reader into the url.
+
+        The bytes are sent as they are read from the reader, so any binary content can
+        be uploaded without holding it in memory.
 
         Arguments:
             :end_point: Path to append to the url passed in the constructor.
             :params: Url params to add
             :options: More options for the request library.
+            :method: POST or PUT, the upload method of the client by default.
         """
         url = self._fetch_url(endpoint or "")
-        buff = io.StringIO(bytes(reader.read()).decode(encoding="utf-8"))
-        request = self._build_request("POST", url, default_data=buff, default_params=params)
+        buff: Union[protocols.ByteReader, Iterator[bytes]]
+        headers = {}
+        if self.compress_uploads:
+            # the compressed length isn't known until the end, it's sent in chunks
+            buff = _gzip_chunks(reader, self.block_size)
+            headers["Content-Encoding"] = "gzip"
+        elif _is_seekable(reader):
+            # the length is known, requests sends the file with a Content-Length
+            buff = reader
+        else:
+            # streams of unknown length are sent with chunked transfer encoding
+            buff = iter(functools.partial(reader.read, self.block_size), b"")
+        request = self._build_request(
+            method or self.upload_method,
+            url,
+            default_data=buff,
+            default_params=params,
+            default_headers=headers,
+        )
         self._send_request(request, default_options=options)
 
     # Helpers:
 
+    def _get_cached(
+        self,
+        writer: protocols.ByteWriter,
+        url: str,
+        params: Optional[dict],
+        options: Optional[dict],
+    ) -> None:
+        request = self._build_request("GET", url, default_params=params)
+        key = http_cache.cache_key(request.url, self.username)
+        meta = http_cache.HTTP_CACHE.lookup(key)
+
+        if meta is not None:
+            fresh = self.cache_ttl and time.time() - meta["validated_at"] < self.cache_ttl
+            if fresh and http_cache.HTTP_CACHE.read_into(key, writer):
+                return
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            request = self._build_request(
+                "GET", url, default_params=params, default_headers=headers
+            )
+
+        response = self._send_get(request, options)
+        with response:
+            if response.status_code == 304 and meta is not None:
+                if http_cache.HTTP_CACHE.read_into(key, writer):
+                    http_cache.HTTP_CACHE.refresh(key, meta)
+                    return
+                # evicted in the meantime, download it again
+                http_cache.HTTP_CACHE.remove(key)
+                return self._get_cached(writer, url, params, options)
+
+            chunks = response.iter_content(chunk_size=self.block_size)
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            no_store = "no-store" in response.headers.get("Cache-Control", "")
+            if (meta["etag"] or meta["last_modified"] or self.cache_ttl) and not no_store:
+                chunks = http_cache.HTTP_CACHE.store(key, meta, chunks)
+            for chunk in chunks:
+                writer.write(chunk)
+
+    def _send_get(
+        self, request: requests.PreparedRequest, options: Optional[dict]
+    ) -> requests.Response:
+        # the body is streamed, the response is returned as soon as the headers arrive
+        options = {**(options or {}), "stream": True}
+        if not self.hedge:
+            return self._send_request(request, default_options=options)
+        return http_hedging.HTTP_HEDGING.send(
+            (self.protocol, self.hostname, self.port),
+            lambda: self._send_request(request, default_options=options),
+        )
+
     def _fetch_url(self, endpoint: str) -> str:
         if endpoint == "" and self.endpoint == "":
             raise exceptions.HTTPError("Missing URL end point")
@@ -135,18 +453,20 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
         self,
         method: str,
         url: str,
-        default_data: Optional[protocols.Reader] = None,
+        default_data: Optional[Union[protocols.ByteReader, Iterator[bytes]]] = None,
         default_params: Optional[dict] = None,
+        default_headers: Optional[dict] = None,
     ):
-        data: Union[protocols.Reader, list] = default_data or []
+        data: Union[protocols.ByteReader, Iterator[bytes], list] = default_data or []
         params = default_params or {}
+        headers = {**self.headers, **(default_headers or {})}
 
-        if method == "GET":
+        if method in ("GET", "HEAD"):
             # GET uses params
-            request = requests.Request(method, url, params=params, headers=self.headers)
-        elif method == "POST":
-            # POST uses data & params
-            request = requests.Request(method, url, data=data, params=params, headers=self.headers)
+            request = requests.Request(method, url, params=params, headers=headers)
+        elif method in UPLOAD_METHODS:
+            # POST and PUT use data & params
+            request = requests.Request(method, url, data=data, params=params, headers=headers)
         else:
             raise NotImplementedError
 
@@ -178,3 +498,116 @@ class HTTPClient(base_client.BaseClient["HTTPClient"]):
             response.raise_for_status()
         except requests.exceptions.HTTPError:
             raise exceptions.HTTPError(f"{response.status_code}: {response.reason}")
+
+
+class HTTPSessionPool:
+    """Sessions shared by the http clients of the same host and credentials.
+
+    Each session keeps a pool of open connections per host, so consecutive requests skip the
+    tcp and tls handshakes. The sessions are closed at interpreter exit.
+    """
+
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None):
+        """Create an empty pool, the sizes default to the environment or to requests."""
+        self.pool_connections = int(
+            pool_connections
+            or os.getenv(POOL_CONNECTIONS_ENV)
+            or adapters.DEFAULT_POOLSIZE
+        )
+        self.pool_maxsize = int(
+            pool_maxsize or os.getenv(POOL_MAXSIZE_ENV) or adapters.DEFAULT_POOLSIZE
+        )
+        self._sessions: Dict[Hashable, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def configure(
+        self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None
+    ) -> None:
+        """Change the hosts with open connections per session and/or the connections per host.
+
+        The current sessions are closed, the new sizes apply to the next ones.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        self.clear()
+
+    def get(self, key: Hashable, auth: Optional[tuple] = None) -> requests.Session:
+        """Return the session for the key, creating it if needed."""
+        with self._lock:
+            # connections inherited from the parent process can't be shared
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._sessions.clear()
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = self._new_session(auth)
+            return session
+
+    def clear(self) -> None:
+        """Close all the sessions."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def size(self) -> int:
+        """Return the number of sessions."""
+        with self._lock:
+            return len(self._sessions)
+
+    def _new_session(self, auth: Optional[tuple]) -> requests.Session:
+        session = requests.Session()
+        session.auth = auth
+        adapter = adapters.HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+class _HTTPSessionPoolHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[HTTPSessionPool] = HTTPSessionPool()
+
+
+HTTP_SESSIONS = _HTTPSessionPoolHolder().instance
+atexit.register(HTTP_SESSIONS.clear)
+
+
+def _skip(chunks: Iterator[bytes], size: int) -> Iterator[bytes]:
+    for chunk in chunks:
+        if size >= len(chunk):
+            size -= len(chunk)
+            continue
+        yield chunk[size:]
+        size = 0
+
+
+def _check_identity(url: str, response: requests.Response) -> None:
+    # requests decodes the body, the offsets would no longer match the ones of the resource
+    encoding = response.headers.get("Content-Encoding", "identity")
+    if encoding.lower() != "identity":
+        raise exceptions.HTTPError(
+            f"{url} sent a response encoded with {encoding} instead of the raw bytes"
+        )
+
+
+def _gzip_chunks(reader: protocols.ByteReader, block_size: int) -> Iterator[bytes]:
+    # wbits=31 writes the gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(wbits=31)
+    for block in iter(functools.partial(reader.read, block_size), b""):
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _is_seekable(reader: protocols.ByteReader) -> bool:
+    seekable = getattr(reader, "seekable", None)
+    return bool(seekable and seekable())
@@ -0,0 +1,180 @@
+"""Hedged http requests.
+
+A few slow replicas behind a load balancer can dominate the tail latency of the requests.
+When a request hasn't got a response after a delay, usually a high percentile of the latencies
+seen for the host, a duplicate is sent and the first response wins. The other one is closed as
+soon as it arrives.
+
+Only idempotent requests should be hedged.
+"""
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Callable, ClassVar, Deque, Dict, Hashable, NamedTuple, Optional, Tuple
+
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["HTTP_HEDGING", "HedgingPolicy", "HedgingStats"]
+
+DEFAULT_PERCENTILE = 95.0
+# latencies kept per host to compute the percentile
+DEFAULT_WINDOW = 100
+# delays used until the host has enough latency samples, and the minimum delay
+DEFAULT_INITIAL_DELAY = 1.0
+DEFAULT_MIN_DELAY = 0.01
+MIN_SAMPLES = 10
+DEFAULT_MAX_WORKERS = 32
+
+
+class HedgingStats(NamedTuple):
+    """Counters of the hedged requests."""
+
+    requests: int
+    hedges: int
+    hedge_wins: int
+
+
+class HedgingPolicy:
+    """Send a duplicate of the requests lacking a response after a percentile of the latencies."""
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        window: int = DEFAULT_WINDOW,
+        initial_delay: float = DEFAULT_INITIAL_DELAY,
+        min_delay: float = DEFAULT_MIN_DELAY,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Create a policy, the thread pool sending the requests is started on first use."""
+        self.percentile = percentile
+        self.window = window
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_workers = max_workers
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies: Dict[Hashable, Deque[float]] = {}
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        percentile: Optional[float] = None,
+        window: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        min_delay: Optional[float] = None,
+    ) -> None:
+        """Change the settings of the policy, the latencies seen so far are discarded."""
+        with self._lock:
+            if percentile is not None:
+                self.percentile = percentile
+            if window is not None:
+                self.window = window
+            if initial_delay is not None:
+                self.initial_delay = initial_delay
+            if min_delay is not None:
+                self.min_delay = min_delay
+            self._latencies.clear()
+
+    def stats(self) -> HedgingStats:
+        """Return the number of requests, of hedges sent and of hedges that won."""
+        with self._lock:
+            return HedgingStats(
+                requests=self.requests, hedges=self.hedges, hedge_wins=self.hedge_wins
+            )
+
+    def reset_stats(self) -> None:
+        """Set the counters to zero."""
+        with self._lock:
+            self.requests = 0
+            self.hedges = 0
+            self.hedge_wins = 0
+
+    def delay(self, key: Hashable) -> float:
+        """Return the seconds to wait for a response of the host before hedging."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, []))
+        if len(latencies) < MIN_SAMPLES:
+            return self.initial_delay
+        index = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+        return max(latencies[index], self.min_delay)
+
+    def send(self, key: Hashable, send: Callable[[], requests.Response]) -> requests.Response:
+        """Call send, calling it again if there isn't a response within the delay of the key.
+
+        The exception of the first call is raised if both of them fail.
+        """
+        executor = self._get_executor()
+        with self._lock:
+            self.requests += 1
+
+        futures = [executor.submit(_timed, send)]
+        done, _ = concurrent.futures.wait(futures, timeout=self.delay(key))
+        if not done:
+            logger.debug(f"hedging request to {key}")
+            with self._lock:
+                self.hedges += 1
+            futures.append(executor.submit(_timed, send))
+
+        winner = _first_successful(futures)
+        for future in futures:
+            if future is not winner:
+                future.add_done_callback(_close_response)
+        if winner is None:
+            # both failed
+            return futures[0].result()[0]
+
+        response, latency = winner.result()
+        with self._lock:
+            if winner is not futures[0]:
+                self.hedge_wins += 1
+            latencies = self._latencies.setdefault(key, collections.deque(maxlen=self.window))
+            latencies.append(latency)
+        return response
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="tentaclio-hedge"
+                )
+            return self._executor
+
+
+def _timed(send: Callable[[], requests.Response]) -> Tuple[requests.Response, float]:
+    start = time.monotonic()
+    response = send()
+    return response, time.monotonic() - start
+
+
+def _first_successful(futures) -> Optional[concurrent.futures.Future]:
+    pending = set(futures)
+    while pending:
+        done, pending = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            if future.exception() is None:
+                return future
+    return None
+
+
+def _close_response(future: concurrent.futures.Future) -> None:
+    # the losing request keeps a connection busy until its response is closed
+    if not future.cancelled() and future.exception() is None:
+        future.result()[0].close()
+
+
+class _HedgingPolicyHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[HedgingPolicy] = HedgingPolicy()
+
+
+HTTP_HEDGING = _HedgingPolicyHolder().instance
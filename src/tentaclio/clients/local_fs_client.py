@@ -1,6 +1,8 @@
 """Local filesystem client."""
+import functools
 import os
-from typing import Iterable, Union
+import shutil
+from typing import IO, Iterable, Iterator, Union
 
 from tentaclio import fs, protocols, urls
 
@@ -17,7 +19,7 @@ class LocalFSClient(base_client.BaseClient["LocalFSClient"]):
 
     path: str
 
-    def __init__(self, url: Union[urls.URL, str]) -> None:
+    def __init__(self, url: Union[urls.URL, str], **kwargs) -> None:
         """Create a new LocalFS client."""
         super().__init__(url)
 
@@ -40,7 +42,20 @@ class LocalFSClient(base_client.BaseClient["LocalFSClient"]):
     def put(self, reader: protocols.ByteReader, **kwargs) -> None:
         """Write the contents of the reader to the file."""
         with open(self.path, "wb") as f:
-            f.write(bytes(reader.read()))
+            shutil.copyfileobj(reader, f, base_client.DEFAULT_CHUNK_SIZE)
+
+    def iter_chunks(
+        self, chunk_size: int = base_client.DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[bytes]:
+        """Yield the contents of the file in chunks of at most chunk_size bytes."""
+        with open(self.path, "rb") as f:
+            yield from iter(functools.partial(f.read, chunk_size), b"")
+
+    # File methods
+
+    def open_file(self, mode: str = "rb") -> IO[bytes]:
+        """Open the file in binary mode returning the os file object."""
+        return open(self.path, mode)
 
     # scandir related methods
 
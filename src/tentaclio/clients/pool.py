@@ -0,0 +1,177 @@
+"""Process wide pool of idle connections.
+
+Opening a connection means a tcp handshake plus a login for ftp, and a key exchange plus the
+authentication for sftp. Clients give their connections back to the pool when they are closed,
+so the next client for the same server and user skips all of that.
+
+Idle connections are closed by a background reaper once they've been idle for the idle timeout,
+and are checked before being reused, broken ones are discarded.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, ClassVar, Dict, Hashable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CONNECTION_POOL", "ConnectionPool"]
+
+POOL_MAX_SIZE_ENV = "TENTACLIO__POOL_MAX_SIZE"
+POOL_IDLE_TIMEOUT_ENV = "TENTACLIO__POOL_IDLE_TIMEOUT"
+
+# idle connections kept per server and user
+DEFAULT_POOL_MAX_SIZE = 4
+# seconds, most servers drop idle sessions after a few minutes
+DEFAULT_POOL_IDLE_TIMEOUT = 60.0
+
+ConnectionCheck = Callable[[Any], bool]
+ConnectionCloser = Callable[[Any], None]
+
+
+class ConnectionPool:
+    """Idle connections grouped by a key made of the scheme, host, port and credentials."""
+
+    def __init__(self, max_size: Optional[int] = None, idle_timeout: Optional[float] = None):
+        """Create a pool, the settings default to the environment or the module defaults.
+
+        A max_size of zero disables the pool.
+        """
+        env_max_size = os.getenv(POOL_MAX_SIZE_ENV)
+        env_idle_timeout = os.getenv(POOL_IDLE_TIMEOUT_ENV)
+        self.max_size = int(
+            max_size if max_size is not None else env_max_size or DEFAULT_POOL_MAX_SIZE
+        )
+        self.idle_timeout = float(
+            idle_timeout
+            if idle_timeout is not None
+            else env_idle_timeout or DEFAULT_POOL_IDLE_TIMEOUT
+        )
+        self._idle: Dict[Hashable, List[Tuple[Any, float, ConnectionCloser]]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._reaper: Optional[threading.Timer] = None
+
+    def configure(
+        self, max_size: Optional[int] = None, idle_timeout: Optional[float] = None
+    ) -> None:
+        """Change the idle connections kept per key and/or the idle timeout in seconds."""
+        if max_size is not None:
+            self.max_size = max_size
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+        self._close_expired()
+
+    def acquire(self, key: Hashable, is_alive: ConnectionCheck) -> Optional[Any]:
+        """Return an idle connection for the key, None if there isn't a healthy one."""
+        self._close_expired()
+        while True:
+            with self._lock:
+                self._check_fork()
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                # the most recently used is the least likely to be dropped by the server
+                conn, _, close = idle.pop()
+
+            if _is_alive(conn, is_alive):
+                logger.debug("reusing pooled connection")
+                return conn
+            _close(conn, close)
+
+    def release(self, key: Hashable, conn: Any, close: ConnectionCloser) -> None:
+        """Give back a connection so it can be reused, closing it if the pool is full."""
+        self._close_expired()
+        with self._lock:
+            self._check_fork()
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_size:
+                idle.append((conn, time.monotonic(), close))
+                self._schedule_reaper(self.idle_timeout)
+                return
+        _close(conn, close)
+
+    def clear(self) -> None:
+        """Close all the idle connections."""
+        with self._lock:
+            expired = [entry for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        for conn, _, close in expired:
+            _close(conn, close)
+
+    def size(self, key: Optional[Hashable] = None) -> int:
+        """Return the number of idle connections, for the key if given."""
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, []))
+            return sum(len(idle) for idle in self._idle.values())
+
+    # Helpers:
+
+    def _check_fork(self) -> None:
+        # sockets inherited from the parent process can't be shared, forget them
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._idle.clear()
+            # threads don't survive the fork
+            self._reaper = None
+
+    def _schedule_reaper(self, delay: float) -> None:
+        # called with the lock held, a single timer closes the connections as they expire
+        if self._reaper is None:
+            self._reaper = threading.Timer(delay, self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        with self._lock:
+            self._reaper = None
+        self._close_expired()
+        with self._lock:
+            released = [entry[1] for idle in self._idle.values() for entry in idle]
+            if released:
+                self._schedule_reaper(max(min(released) + self.idle_timeout - time.monotonic(), 0))
+
+    def _close_expired(self) -> None:
+        deadline = time.monotonic() - self.idle_timeout
+        expired = []
+        with self._lock:
+            self._check_fork()
+            for idle in self._idle.values():
+                expired += [entry for entry in idle if entry[1] <= deadline]
+                kept = [entry for entry in idle if entry[1] > deadline]
+                # the pool might have been shrunk
+                excess = max(len(kept) - self.max_size, 0)
+                expired += kept[:excess]
+                idle[:] = kept[excess:]
+        for conn, _, close in expired:
+            _close(conn, close)
+
+
+def _is_alive(conn: Any, is_alive: ConnectionCheck) -> bool:
+    try:
+        return is_alive(conn)
+    except Exception:
+        return False
+
+
+def _close(conn: Any, close: ConnectionCloser) -> None:
+    try:
+        close(conn)
+    except Exception as e:
+        logger.debug(f"error closing pooled connection: {e}")
+
+
+class _ConnectionPoolHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[ConnectionPool] = ConnectionPool()
+
+
+CONNECTION_POOL = _ConnectionPoolHolder().instance
+atexit.register(CONNECTION_POOL.clear)
@@ -0,0 +1,82 @@
+"""Resumable transfers.
+
+Clients retry the transfers interrupted by a network error from the bytes already moved,
+instead of starting from zero: downloads restart at the number of bytes written so far and
+uploads at the size of the partial remote file. The number of retries of a transfer is its
+budget, set by the clients `retries` argument or the TENTACLIO__TRANSFER_RETRIES env variable.
+"""
+import logging
+import os
+import time
+from typing import IO, Callable, Optional, Tuple, Type, cast
+
+from tentaclio import protocols
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CountingWriter", "retry_budget", "retry_transfer", "seekable_reader"]
+
+RETRIES_ENV = "TENTACLIO__TRANSFER_RETRIES"
+DEFAULT_RETRIES = 0
+
+# seconds before the first retry, doubled on each of the next ones
+BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+
+
+def retry_budget(retries: Optional[int] = None, query: Optional[dict] = None) -> int:
+    """Return the retries of a transfer, from the argument, the url query or the environment."""
+    if retries is not None:
+        return retries
+    return int((query or {}).get("retries") or os.getenv(RETRIES_ENV) or DEFAULT_RETRIES)
+
+
+class CountingWriter:
+    """Writer keeping track of the number of bytes written, the offset to resume from."""
+
+    def __init__(self, writer: protocols.ByteWriter):
+        """Wrap the writer."""
+        self.writer = writer
+        self.offset = 0
+
+    def write(self, contents: bytes) -> int:
+        """Write the contents into the wrapped writer."""
+        self.writer.write(contents)
+        self.offset += len(contents)
+        return len(contents)
+
+
+def seekable_reader(reader: protocols.ByteReader) -> Optional[IO[bytes]]:
+    """Return the reader if it can be sought back to resume an upload, None otherwise."""
+    seekable = getattr(reader, "seekable", None)
+    if seekable and seekable():
+        return cast(IO[bytes], reader)
+    return None
+
+
+def retry_transfer(
+    transfer: Callable[[], None],
+    retries: int,
+    errors: Tuple[Type[BaseException], ...],
+    recover: Callable[[], None],
+    description: str,
+) -> None:
+    """Call transfer, calling recover and retrying it while it fails with one of the errors.
+
+    Transfer is expected to resume from where the previous attempt stopped. A failed
+    recover uses up a retry like a failed transfer. The last error is raised once the
+    retries are exhausted.
+    """
+    attempt = 0
+    while True:
+        try:
+            if attempt:
+                recover()
+            return transfer()
+        except errors as e:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            logger.warning(f"{description} interrupted, resuming ({attempt}/{retries}): {e}")
+            time.sleep(min(BACKOFF * 2 ** (attempt - 1), MAX_BACKOFF))
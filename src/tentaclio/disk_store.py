@@ -0,0 +1,133 @@
+"""Base on-disk store shared by the caches.
+
+Every entry is made of a data file and a metadata file named after its key. The data is
+written under a temporary name and moved into place once complete, so readers never see half
+written entries. The least recently used entries are evicted when the store grows past its
+maximum size, the modification time of the data files tracks their last use, so the order is
+shared between processes using the same directory.
+"""
+import contextlib
+import logging
+import os
+import threading
+import uuid
+from typing import IO, Iterator, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+DATA_EXTENSION = ".data"
+META_EXTENSION = ".meta"
+
+
+class DiskStore:
+    """Directory of entries with least recently used eviction."""
+
+    def __init__(self, directory: str, max_size: int):
+        """Create a store in directory holding up to max_size bytes of data."""
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def configure(self, directory: Optional[str] = None, max_size: Optional[int] = None):
+        """Change the cache directory and/or its maximum size in bytes."""
+        if directory is not None:
+            self.directory = os.path.expanduser(directory)
+        if max_size is not None:
+            self.max_size = max_size
+
+    def clear(self) -> None:
+        """Remove all the cached entries."""
+        for key in self._keys():
+            self.remove(key)
+
+    def remove(self, key: str) -> None:
+        """Remove the entry."""
+        _remove(self.data_path(key))
+        _remove(self.meta_path(key))
+
+    def data_path(self, key: str) -> str:
+        """Return the path of the data of the entry."""
+        return os.path.join(self.directory, key + DATA_EXTENSION)
+
+    def meta_path(self, key: str) -> str:
+        """Return the path of the metadata of the entry."""
+        return os.path.join(self.directory, key + META_EXTENSION)
+
+    def read_meta(self, key: str) -> Optional[str]:
+        """Return the metadata of the entry, None if there isn't any."""
+        try:
+            with open(self.meta_path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write_meta(self, key: str, contents: str) -> None:
+        """Replace the metadata of the entry."""
+        path = self.meta_path(key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(contents)
+        os.replace(temp_path, path)
+
+    def touch(self, key: str) -> bool:
+        """Mark the entry as recently used, False if it has been evicted."""
+        try:
+            os.utime(self.data_path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def write_data(self, key: str) -> Iterator[IO[bytes]]:
+        """Yield a temporary file replacing the data of the entry when the block succeeds.
+
+        The metadata of the entry is removed, it mustn't describe the new contents. If the
+        block raises the previous entry is left untouched.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = os.path.join(self.directory, f".{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                yield f
+            with self._lock:
+                _remove(self.meta_path(key))
+                os.replace(temp_path, self.data_path(key))
+        finally:
+            _remove(temp_path)
+
+    def evict(self, keep: str) -> None:
+        """Remove the least recently used entries but keep until the data fits the max size."""
+        entries = []
+        for key in self._keys():
+            try:
+                stat = os.stat(self.data_path(key))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, key))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_size:
+                break
+            if key == keep:
+                continue
+            logger.info(f"evicting {key} from {self.directory}")
+            self.remove(key)
+            total -= size
+
+    # Helpers:
+
+    def _keys(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [name[: -len(DATA_EXTENSION)] for name in names if name.endswith(DATA_EXTENSION)]
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
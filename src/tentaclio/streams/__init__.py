@@ -1,4 +1,5 @@
 """Streams hide clients and allow access to stream resources via a simple read/write interface."""
 from .api import *  # noqa
+from .cache import *  # noqa
 from .stream_client_handler import *  # noqa
 from .stream_registry import *  # noqa
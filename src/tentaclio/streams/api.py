@@ -1,5 +1,8 @@
 """Main entry points to tentaclio-io."""
-from typing import ContextManager, Optional, Union
+import collections
+import concurrent.futures
+import itertools
+from typing import Any, ContextManager, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 from tentaclio import protocols
 from tentaclio.credentials import authenticate
@@ -8,10 +11,13 @@ from .base_stream import DirtyStreamerWriter, StreamerReader, StreamerWriter
 from .stream_registry import STREAM_HANDLER_REGISTRY, _WriterContextManager
 
 
-__all__ = ["open", "make_empty_safe"]
+__all__ = ["open", "open_many", "make_empty_safe"]
 
 VALID_MODES = ("", "rb", "wb", "rt", "wt", "r", "w", "b", "t")
 
+# readers opened concurrently by open_many
+DEFAULT_MAX_WORKERS = 16
+
 AnyContextStreamerReaderWriter = Union[
     ContextManager[StreamerReader], ContextManager[StreamerWriter]
 ]
@@ -41,6 +47,37 @@ def open(url: str, mode: Optional[str] = None, **kwargs) -> AnyContextStreamerRe
         return _open_reader(url=url, mode=mode, **kwargs)
 
 
+def open_many(
+    urls: Iterable[str],
+    mode: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = False,
+    return_exceptions: bool = False,
+    **kwargs,
+) -> Iterator[Tuple[str, Any]]:
+    """Open readers for many urls concurrently, yielding (url, reader) pairs.
+
+    The readers are opened by a pool of max_workers threads, with at most twice as many
+    waiting to be consumed. They are yielded as they are ready, or in the input order
+    if ordered is set, and the caller is responsible for closing them.
+
+    Arguments:
+        :mode: a read mode as in `open`.
+        :return_exceptions: yield the exception in place of the reader for the urls that
+            failed rather than raising it.
+        :kwargs: extra arguments for `open`.
+    Examples:
+        >>> for url, reader in open_many(tentaclio.listdir(folder), "rb"):
+        ...     with reader:
+        ...         process(url, reader.read())
+    """
+    mode = mode or ""
+    _assert_mode(mode)
+    if "w" in mode:
+        raise ValueError(f"Mode {mode} is not allowed, open_many only opens readers")
+    return _open_many(iter(urls), mode, max_workers, ordered, return_exceptions, kwargs)
+
+
 def make_empty_safe(
     context_writer: _WriterContextManager,
 ) -> ContextManager[protocols.WriterClosable]:
@@ -68,3 +105,61 @@ def _open_reader(url: str, mode: str, **kwargs) -> ContextManager[StreamerReader
     """Open a url and return a reader."""
     authenticated = authenticate(url)
     return STREAM_HANDLER_REGISTRY.open_stream_reader(authenticated, mode, extras=kwargs)
+
+
+def _open_many(
+    urls: Iterator[str],
+    mode: str,
+    max_workers: int,
+    ordered: bool,
+    return_exceptions: bool,
+    kwargs: dict,
+) -> Iterator[Tuple[str, Any]]:
+    """Yield the readers of the urls as the pool opens them."""
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+    futures: Dict[concurrent.futures.Future, str] = {}
+    queued: Deque[concurrent.futures.Future] = collections.deque()
+
+    def submit():
+        # keep a bounded number of readers in flight
+        for url in itertools.islice(urls, 2 * max_workers - len(futures)):
+            future = executor.submit(_open_reader_resource, url, mode, kwargs)
+            futures[future] = url
+            queued.append(future)
+
+    try:
+        submit()
+        while futures:
+            if ordered:
+                future = queued.popleft()
+                concurrent.futures.wait([future])
+            else:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                future = next(iter(done))
+                queued.remove(future)
+            url = futures.pop(future)
+            submit()
+
+            error = future.exception()
+            if error is None:
+                yield url, future.result()
+            elif return_exceptions:
+                yield url, error
+            else:
+                raise error
+    finally:
+        # the iteration stopped early, nobody will consume the pending readers
+        for future in futures:
+            future.add_done_callback(_close_reader)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _open_reader_resource(url: str, mode: str, kwargs: dict) -> StreamerReader:
+    return _open_reader(url, mode, **kwargs).__enter__()
+
+
+def _close_reader(future: concurrent.futures.Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
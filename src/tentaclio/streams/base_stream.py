@@ -18,9 +18,16 @@ buffer to the underlying client.
 """
 import abc
 import io
-from typing import IO, Any, ContextManager, Optional, Protocol
+import queue
+import threading
+from typing import IO, Any, ContextManager, Iterable, Iterator, List, Optional, Protocol, cast
 
 from tentaclio import protocols
+from tentaclio.clients.base_client import DEFAULT_CHUNK_SIZE
+
+
+# chunks waiting to be uploaded by streaming writers
+DEFAULT_MAX_PENDING_CHUNKS = 4
 
 
 class Streamer(Protocol):
@@ -48,6 +55,21 @@ class StreamerContextManager(Streamer, ContextManager, Protocol):
     ...
 
 
+class ChunkStreamer(Protocol):
+    """Interface for connections able to stream their contents chunk by chunk."""
+
+    @abc.abstractmethod
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE, **params) -> Iterator[bytes]:
+        """Yield the contents of the stream in chunks of at most chunk_size bytes."""
+        ...
+
+
+class ChunkStreamerContextManager(ChunkStreamer, StreamerContextManager, Protocol):
+    """Interface for stream-based connections able to stream chunks within context managers."""
+
+    ...
+
+
 class StreamBaseIO:
     """Base class for IO streams that interact with Streamers.
 
@@ -63,10 +85,38 @@ class StreamBaseIO:
         """Create a StreamBase which wraps the provided buffer."""
         self.buffer = buffer
 
+    def __enter__(self):
+        """Return the stream itself, it'll be closed when leaving the context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the stream."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the stream, to be overriden by readers and writers."""
+        self.buffer.close()
+
     @property
-    def closed(self):
+    def closed(self) -> bool:
         """Tell if the resource is closed."""
-        self.buffer.closed
+        return self.buffer.closed
+
+    def readable(self) -> bool:
+        """Mark this stream as not readable."""
+        return False
+
+    def writable(self) -> bool:
+        """Mark this stream as not writable."""
+        return False
+
+    def isatty(self) -> bool:
+        """Mark this stream as not interactive."""
+        return False
+
+    def fileno(self) -> int:
+        """Raise UnsupportedOperation as streams aren't backed by a file descriptor."""
+        raise io.UnsupportedOperation("fileno")
 
     def __iter__(self):
         """Return the resource as an iterable.
@@ -110,15 +160,32 @@ class StreamerWriter(StreamBaseIO):
         super().__init__(buffer)
         self.client = client
 
+    def writable(self) -> bool:
+        """Mark this stream as writable."""
+        return True
+
     def write(self, contents: Any) -> int:
         """Write the contents to the underlying buffer."""
         return self.buffer.write(contents)
 
+    def writelines(self, lines: Iterable[Any]) -> None:
+        """Write the lines to the underlying buffer."""
+        for line in lines:
+            self.write(line)
+
     def close(self) -> None:
         """Flush and close the writer."""
         self._flush()
         self.buffer.close()
 
+    def discard(self) -> None:
+        """Close the writer after a failure, writers that can't roll back flush as usual."""
+        self.close()
+
+    def _close_unflushed(self):
+        # release the buffer without sending its contents
+        self.buffer.close()
+
     def _flush(self):
         self.buffer.seek(0)
         # atomic put so we open/close connections swiftly
@@ -159,7 +226,16 @@ class DirtyStreamerWriter(StreamerWriter):
         """Flush and close the writer."""
         if self.dirty:
             self.writer._flush()
-        self.buffer.close()
+            self.buffer.close()
+        else:
+            self.writer._close_unflushed()
+
+    def discard(self) -> None:
+        """Discard the contents of the wrapped writer, nothing is flushed if it's clean."""
+        if self.dirty:
+            self.writer.discard()
+        else:
+            self.writer._close_unflushed()
 
 
 class StreamerReader(StreamBaseIO):
@@ -183,18 +259,228 @@ class StreamerReader(StreamBaseIO):
             self.client.get(self.buffer)
         self.buffer.seek(0)
 
+    def readable(self) -> bool:
+        """Mark this stream as readable."""
+        return True
+
     def read(self, size: int = -1):
         """Read the contents of the buffer."""
         return self.buffer.read(size)
 
+    def read1(self, size: int = -1) -> bytes:
+        """Read up to size bytes with at most one call to the underlying stream."""
+        return self._binary_buffer("read1").read1(size)
+
+    def readinto(self, b) -> int:
+        """Read bytes into the pre-allocated object b, returning the number of bytes read."""
+        return self._binary_buffer("readinto").readinto(b)
+
+    def readinto1(self, b) -> int:
+        """Read bytes into b with at most one call to the underlying stream."""
+        return self._binary_buffer("readinto1").readinto1(b)
+
     def readline(self, size: int = -1):
         """Read and return one line from the buffer."""
         # Additional method required for unpickling Python objects
         return self.buffer.readline(size)
 
+    def readlines(self, hint: int = -1) -> List:
+        """Read and return a list of lines from the buffer."""
+        return self.buffer.readlines(hint)
+
+    def getbuffer(self) -> memoryview:
+        """Return a read only view of the contents without copying them.
+
+        Only readers holding the whole contents in memory support it.
+        """
+        getbuffer = getattr(self._binary_buffer("getbuffer"), "getbuffer", None)
+        if getbuffer is None:
+            raise io.UnsupportedOperation("getbuffer")
+        return getbuffer().toreadonly()
+
     def close(self) -> None:
-        """Close the writer."""
-        self.buffer.close()
+        """Close the reader."""
+        try:
+            self.buffer.close()
+        except BufferError:
+            # views returned by getbuffer are still alive, the memory is released with them
+            pass
+
+    def _binary_buffer(self, operation: str) -> io.BufferedIOBase:
+        if isinstance(self.buffer, io.TextIOBase):
+            raise io.UnsupportedOperation(f"{operation} is only available in binary mode")
+        return cast(io.BufferedIOBase, self.buffer)
+
+
+class _ChunkIteratorIO(io.RawIOBase):
+    """Forward only raw stream that pulls its contents from an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes] = ()):
+        self.chunks: Iterator[bytes] = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self.chunks))
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._pending))
+        b[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        # give generators the chance to release the resources they hold
+        close = getattr(self.chunks, "close", None)
+        if close is not None:
+            close()
+        super().close()
+
+
+class ChunkedStreamerReader(StreamerReader):
+    """Forward only reader that pulls chunks from the client as they are consumed.
+
+    Contrary to StreamerReader the contents are not loaded upfront, so memory
+    is bounded by the chunk size no matter how big the resource is. The client
+    connection is kept open until the reader is closed.
+    """
+
+    client: ChunkStreamerContextManager
+
+    def __init__(
+        self,
+        client: ChunkStreamerContextManager,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: Optional[str] = None,
+    ):
+        """Create a reader streaming the client contents, decoded as text if encoding is set."""
+        self.chunk_size = chunk_size
+        self.raw = _ChunkIteratorIO()
+        buffer: IO = io.BufferedReader(self.raw, buffer_size=chunk_size)
+        if encoding is not None:
+            buffer = io.TextIOWrapper(buffer, encoding=encoding)
+        super().__init__(client, buffer)
+
+    def _load(self):
+        self.client.__enter__()
+        self.raw.chunks = iter(self.client.iter_chunks(chunk_size=self.chunk_size))
+
+    def seekable(self) -> bool:
+        """Mark this stream as not seekable."""
+        return False
+
+    def close(self) -> None:
+        """Close the reader and the client connection."""
+        try:
+            self.buffer.close()
+        finally:
+            self.client.__exit__(None, None, None)
+
+
+class _UploadPipe(io.RawIOBase):
+    """Raw stream handing the written chunks to a background thread that uploads them.
+
+    The chunks go through a bounded queue so the writer blocks, rather than piling up data
+    in memory, when the network is slower than the data generation.
+    """
+
+    _poll_interval = 0.1
+
+    def __init__(self, client: StreamerContextManager, max_pending_chunks: int):
+        self.client = client
+        self.queue: queue.Queue = queue.Queue(max_pending_chunks)
+        self.thread: Optional[threading.Thread] = None
+        self.error: Optional[Exception] = None
+        self.finished = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self.start()
+        # the buffered writer reuses its buffer, so the chunk is copied
+        self._send(bytes(b))
+        return len(b)
+
+    def start(self) -> None:
+        """Open the client connection in a background thread uploading the chunks."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._upload, daemon=True)
+            self.thread.start()
+
+    def finish(self) -> None:
+        """Signal the end of the stream and wait for the upload to complete."""
+        if self.finished:
+            return
+        self.finished = True
+        self.start()
+        self._send(None)
+        assert self.thread is not None
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def close(self) -> None:
+        # a connection opened by the first write is always terminated
+        if self.thread is not None:
+            self.finish()
+        super().close()
+
+    def _upload(self) -> None:
+        reader = io.BufferedReader(_ChunkIteratorIO(iter(self.queue.get, None)))
+        try:
+            with self.client:
+                self.client.put(reader)
+        except Exception as e:
+            self.error = e
+
+    def _send(self, chunk: Optional[bytes]) -> None:
+        while True:
+            if self.error is not None:
+                raise self.error
+            assert self.thread is not None
+            if not self.thread.is_alive():
+                raise IOError("The upload finished before the end of the stream")
+            try:
+                self.queue.put(chunk, timeout=self._poll_interval)
+                return
+            except queue.Full:
+                continue
+
+
+class ChunkedStreamerWriter(StreamerWriter):
+    """Writer that uploads the contents while the caller is still writing.
+
+    The client connection is opened on the first write and the data is handed, in blocks of
+    chunk_size bytes, to a background thread that feeds the client put. Generating the data and
+    transferring it over the network happen in parallel with bounded memory.
+    """
+
+    def __init__(
+        self,
+        client: StreamerContextManager,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: Optional[str] = None,
+        max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS,
+    ):
+        """Create a writer uploading to the client, encoding text if encoding is set."""
+        self.pipe = _UploadPipe(client, max_pending_chunks)
+        buffer: IO = io.BufferedWriter(self.pipe, buffer_size=chunk_size)
+        if encoding is not None:
+            buffer = io.TextIOWrapper(buffer, encoding=encoding)
+        super().__init__(client, buffer)
+
+    def seekable(self) -> bool:
+        """Mark this stream as not seekable."""
+        return False
+
+    def _flush(self):
+        self.buffer.flush()
+        self.pipe.finish()
 
 
 class StringToBytesClientReader(StreamerReader):
@@ -227,11 +513,19 @@ class StringToBytesClientWriter(StreamerWriter):
     This is similar to how python itself treats text/binary files.
     """
 
-    inner_buffer: io.BytesIO
+    inner_buffer: IO[bytes]
 
-    def __init__(self, client: StreamerContextManager, encoding: str = "utf-8"):
-        """Create a byte based write that will read from the given client."""
-        self.inner_buffer = io.BytesIO()
+    def __init__(
+        self,
+        client: StreamerContextManager,
+        encoding: str = "utf-8",
+        inner_buffer: Optional[IO[bytes]] = None,
+    ):
+        """Create a byte based write that will read from the given client.
+
+        The bytes are kept in inner_buffer, an in memory buffer by default.
+        """
+        self.inner_buffer = inner_buffer if inner_buffer is not None else io.BytesIO()
         super().__init__(client, io.TextIOWrapper(self.inner_buffer, encoding=encoding))
 
     def _flush(self) -> None:
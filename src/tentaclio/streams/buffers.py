@@ -0,0 +1,99 @@
+"""Buffers backing the stream readers and writers."""
+import io
+import tempfile
+from typing import IO, Optional, cast
+
+
+__all__ = ["SpooledBuffer"]
+
+
+class SpooledBuffer(io.BufferedIOBase):
+    """Binary buffer kept in memory until it grows past max_size, then spilled to a temp file.
+
+    Similar to tempfile.SpooledTemporaryFile, but it's a proper io.BufferedIOBase so it can
+    be wrapped by io.TextIOWrapper in all the supported python versions.
+    """
+
+    max_size: int
+    rolled: bool = False
+    # read by libraries that treat the buffer as a file, like requests when sizing bodies
+    mode = "rb+"
+
+    def __init__(self, max_size: int, dir: Optional[str] = None):
+        """Create an in memory buffer that spills to disk when bigger than max_size bytes."""
+        self.max_size = max_size
+        self.dir = dir
+        self._file: IO[bytes] = io.BytesIO()
+
+    def rollover(self) -> None:
+        """Move the contents of the buffer to a temporary file keeping the position."""
+        if self.rolled:
+            return
+        memory = cast(io.BytesIO, self._file)
+        disk = tempfile.TemporaryFile(dir=self.dir)
+        disk.write(memory.getbuffer())
+        disk.seek(memory.tell())
+        memory.close()
+        self._file = disk
+        self.rolled = True
+
+    def readable(self) -> bool:
+        """Mark this stream as readable."""
+        return True
+
+    def writable(self) -> bool:
+        """Mark this stream as writable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Mark this stream as seekable."""
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read up to size bytes from the buffer."""
+        return self._file.read(-1 if size is None else size)
+
+    def read1(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the buffer."""
+        return self._file.read(size)
+
+    def readinto(self, b) -> int:
+        """Read bytes into the pre-allocated object b."""
+        return cast(io.BufferedIOBase, self._file).readinto(b)
+
+    def write(self, b) -> int:
+        """Write the bytes to the buffer, spilling to disk if it grows too big."""
+        written = self._file.write(b)
+        if self._file.tell() > self.max_size:
+            self.rollover()
+        return written
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change the stream position to the given byte offset."""
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        """Return the current stream position."""
+        return self._file.tell()
+
+    def truncate(self, size: Optional[int] = None) -> int:
+        """Resize the stream to the given size in bytes."""
+        return self._file.truncate(size)
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the temporary file once the buffer has spilled."""
+        if not self.rolled:
+            # spilling to disk just to hand out a descriptor defeats the buffer
+            raise io.UnsupportedOperation("fileno")
+        return self._file.fileno()
+
+    def flush(self) -> None:
+        """Flush the underlying file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the buffer, removing the temporary file if any."""
+        try:
+            super().close()
+        finally:
+            self._file.close()
@@ -0,0 +1,137 @@
+"""Read-through on-disk cache for remote resources.
+
+Fetched resources are stored under the cache directory along with a fingerprint made of
+cheap metadata (sizes, modification times, etags...). Opening a cached url only asks the
+server for that metadata, the contents are served from disk while the fingerprint matches.
+
+The least recently used entries are evicted when the cache grows past its maximum size, see
+`DiskStore`.
+"""
+import abc
+import hashlib
+import logging
+import os
+from typing import ClassVar, ContextManager, NamedTuple, Optional, Protocol
+
+from tentaclio import disk_store
+from tentaclio.urls import URL
+
+from . import base_stream, local_stream
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["STREAM_CACHE", "CacheStats"]
+
+CACHE_DIR_ENV = "TENTACLIO__CACHE_DIR"
+CACHE_MAX_SIZE_ENV = "TENTACLIO__CACHE_MAX_SIZE"
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "tentaclio")
+DEFAULT_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+
+
+class FingerprintStreamer(Protocol):
+    """Interface for connections able to describe the version of the resource."""
+
+    @abc.abstractmethod
+    def get_fingerprint(self, **params) -> Optional[str]:
+        """Return a string that changes when the resource changes, None if unknown."""
+        ...
+
+
+class FingerprintStreamerContextManager(
+    FingerprintStreamer, base_stream.StreamerContextManager, ContextManager, Protocol
+):
+    """Interface for fingerprint based connections within context managers."""
+
+    ...
+
+
+class CacheStats(NamedTuple):
+    """Counters of the cache lookups."""
+
+    hits: int
+    misses: int
+
+
+class StreamCache(disk_store.DiskStore):
+    """On-disk cache of remote resources with least recently used eviction."""
+
+    def __init__(self, directory: Optional[str] = None, max_size: Optional[int] = None):
+        """Create a cache, the settings default to the environment or the module defaults."""
+        super().__init__(
+            directory or os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR,
+            int(max_size or os.getenv(CACHE_MAX_SIZE_ENV) or DEFAULT_CACHE_MAX_SIZE),
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Return the hit and miss counters."""
+        with self._lock:
+            return CacheStats(hits=self.hits, misses=self.misses)
+
+    def reset_stats(self) -> None:
+        """Set the hit and miss counters to zero."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def open_reader(
+        self,
+        client: FingerprintStreamerContextManager,
+        url: URL,
+        encoding: Optional[str] = None,
+    ) -> base_stream.StreamerReader:
+        """Open a reader for the url, downloading it through the client if it's not cached."""
+        # clients depend on the fs module, that in turn depends on streams
+        from tentaclio.clients.local_fs_client import LocalFSClient
+
+        key = hashlib.sha256(url.url.encode("utf-8")).hexdigest()
+        data_path = self.data_path(key)
+
+        with client:
+            fingerprint = client.get_fingerprint()
+            if fingerprint is not None and self.read_meta(key) == fingerprint:
+                try:
+                    reader = local_stream.FileStreamerReader(
+                        LocalFSClient(data_path), encoding=encoding
+                    )
+                    # mark the entry as recently used
+                    self.touch(key)
+                    self._count(hit=True)
+                    return reader
+                except FileNotFoundError:
+                    # evicted by another process
+                    pass
+
+            self._count(hit=False)
+            with self.write_data(key) as f:
+                client.get(f)
+
+        if fingerprint is None:
+            logger.info(f"{url} can't be validated, it won't be served from the cache")
+        else:
+            self.write_meta(key, fingerprint)
+
+        reader = local_stream.FileStreamerReader(LocalFSClient(data_path), encoding=encoding)
+        self.evict(keep=key)
+        return reader
+
+    # Helpers:
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class _StreamCacheHolder:
+    """Module level singleton."""
+
+    instance: ClassVar[StreamCache] = StreamCache()
+
+
+STREAM_CACHE = _StreamCacheHolder().instance
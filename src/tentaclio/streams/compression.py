@@ -0,0 +1,299 @@
+"""Transparent compression of the streams.
+
+With `compression="infer"`, resources whose path ends with a known extension (`.gz`, `.bz2`,
+`.xz`, `.zst`) are decompressed while being read and compressed while being written, the codec
+can also be named explicitly. By default the contents are left untouched. The codec sits between
+the caller and the client reader/writer, so only one block of each form is in flight at any time
+and the compressed bytes are the ones crossing the network.
+"""
+import abc
+import bz2
+import collections
+import concurrent.futures
+import gzip
+import io
+import lzma
+from typing import IO, Any, Deque, Dict, Optional, Protocol, cast
+
+from tentaclio.clients.base_client import DEFAULT_CHUNK_SIZE
+from tentaclio.urls import URL
+
+from . import base_stream
+
+
+__all__ = ["Codec", "CODECS", "get_codec"]
+
+# value of the compression kwarg that picks the codec from the url extension
+INFER = "infer"
+
+
+class Codec(Protocol):
+    """Compression format able to wrap byte streams."""
+
+    name: str
+    extension: str
+
+    @abc.abstractmethod
+    def open_reader(self, fileobj: Any) -> IO[bytes]:
+        """Return a binary stream decompressing the contents read from fileobj."""
+        ...
+
+    @abc.abstractmethod
+    def open_writer(self, fileobj: Any) -> IO[bytes]:
+        """Return a binary stream compressing the written contents into fileobj.
+
+        Closing the stream completes the compressed data but doesn't close fileobj.
+        """
+        ...
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress data into a self contained member that can be concatenated to others."""
+        ...
+
+
+class GzipCodec(Codec):
+    """Gzip codec from the standard library."""
+
+    name = "gzip"
+    extension = ".gz"
+
+    def open_reader(self, fileobj: Any) -> IO[bytes]:
+        """Return a gzip decompressing stream."""
+        return cast(IO[bytes], gzip.GzipFile(fileobj=fileobj, mode="rb"))
+
+    def open_writer(self, fileobj: Any) -> IO[bytes]:
+        """Return a gzip compressing stream."""
+        return cast(IO[bytes], gzip.GzipFile(fileobj=fileobj, mode="wb"))
+
+    def compress(self, data: bytes) -> bytes:
+        """Return a gzip member with the compressed data."""
+        return gzip.compress(data)
+
+
+class Bz2Codec(Codec):
+    """Bzip2 codec from the standard library."""
+
+    name = "bz2"
+    extension = ".bz2"
+
+    def open_reader(self, fileobj: Any) -> IO[bytes]:
+        """Return a bzip2 decompressing stream."""
+        return cast(IO[bytes], bz2.BZ2File(fileobj, mode="rb"))
+
+    def open_writer(self, fileobj: Any) -> IO[bytes]:
+        """Return a bzip2 compressing stream."""
+        return cast(IO[bytes], bz2.BZ2File(fileobj, mode="wb"))
+
+    def compress(self, data: bytes) -> bytes:
+        """Return a bzip2 stream with the compressed data."""
+        return bz2.compress(data)
+
+
+class XzCodec(Codec):
+    """Xz codec from the standard library."""
+
+    name = "xz"
+    extension = ".xz"
+
+    def open_reader(self, fileobj: Any) -> IO[bytes]:
+        """Return a xz decompressing stream."""
+        return cast(IO[bytes], lzma.LZMAFile(fileobj, mode="rb"))
+
+    def open_writer(self, fileobj: Any) -> IO[bytes]:
+        """Return a xz compressing stream."""
+        return cast(IO[bytes], lzma.LZMAFile(fileobj, mode="wb"))
+
+    def compress(self, data: bytes) -> bytes:
+        """Return a xz stream with the compressed data."""
+        return lzma.compress(data)
+
+
+class ZstdCodec(Codec):
+    """Zstandard codec, it requires the zstandard package."""
+
+    name = "zstd"
+    extension = ".zst"
+
+    def open_reader(self, fileobj: Any) -> IO[bytes]:
+        """Return a zstandard decompressing stream reading all the frames."""
+        zstandard = _import_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True)
+        return cast(IO[bytes], io.BufferedReader(reader))
+
+    def open_writer(self, fileobj: Any) -> IO[bytes]:
+        """Return a zstandard compressing stream."""
+        zstandard = _import_zstandard()
+        writer = zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False)
+        return cast(IO[bytes], io.BufferedWriter(writer))
+
+    def compress(self, data: bytes) -> bytes:
+        """Return a zstandard frame with the compressed data."""
+        # compressors aren't thread safe
+        return _import_zstandard().ZstdCompressor().compress(data)
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("The zstandard package is required to handle zstd resources")
+    return zstandard
+
+
+CODECS: Dict[str, Codec] = {
+    codec.name: codec for codec in (GzipCodec(), Bz2Codec(), XzCodec(), ZstdCodec())
+}
+
+
+def get_codec(url: URL, compression: Optional[str] = None) -> Optional[Codec]:
+    """Return the codec of the resource, None if it isn't compressed.
+
+    Arguments:
+        :compression: name of the codec, "infer" to detect it from the extension of the url
+            path, or None to disable the compression.
+    """
+    if compression is None:
+        return None
+    if compression == INFER:
+        path = (url.path or "").lower()
+        for codec in CODECS.values():
+            if path.endswith(codec.extension):
+                return codec
+        return None
+    if compression not in CODECS:
+        valid = ",".join(CODECS)
+        raise ValueError(f"Compression {compression} is not supported. Valid codecs are {valid}")
+    return CODECS[compression]
+
+
+class _ParallelCompressor(io.RawIOBase):
+    """Raw stream compressing blocks of the contents on a thread pool.
+
+    Each block becomes an independent member (gzip, bz2, xz) or frame (zstd), written in
+    order to fileobj. The concatenation is a valid compressed stream for the standard tools,
+    and since the compression libraries release the GIL the blocks are compressed in parallel.
+    """
+
+    def __init__(self, codec: Codec, fileobj: Any, threads: int, block_size: int):
+        self.codec = codec
+        self.fileobj = fileobj
+        self.block_size = block_size
+        self.executor = concurrent.futures.ThreadPoolExecutor(threads)
+        # bounds the memory held by blocks waiting to be written
+        self.max_pending = 2 * threads
+        self.pending: Deque[concurrent.futures.Future] = collections.deque()
+        self.block = bytearray()
+        self.members = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self.block += b
+        size = self.block_size
+        while len(self.block) >= size:
+            self._submit(bytes(self.block[:size]))
+            del self.block[:size]
+        return len(b)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            # an empty resource still needs a valid compressed stream
+            if self.block or not self.members:
+                self._submit(bytes(self.block))
+                self.block.clear()
+            while self.pending:
+                self._write_next()
+        finally:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            super().close()
+
+    def _submit(self, block: bytes) -> None:
+        self.pending.append(self.executor.submit(self.codec.compress, block))
+        self.members += 1
+        while len(self.pending) > self.max_pending:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        self.fileobj.write(self.pending.popleft().result())
+
+
+class DecompressingStreamerReader(base_stream.StreamerReader):
+    """Reader decompressing the contents of another binary reader as they are consumed."""
+
+    def __init__(
+        self,
+        source: base_stream.StreamerReader,
+        codec: Codec,
+        encoding: Optional[str] = None,
+    ):
+        """Create a reader decompressing source, decoded as text if encoding is set."""
+        self.source = source
+        buffer: IO = codec.open_reader(source)
+        if encoding is not None:
+            buffer = io.TextIOWrapper(buffer, encoding=encoding)
+        super().__init__(source.client, buffer)
+
+    def _load(self):
+        # the source reader is already connected
+        ...
+
+    def seekable(self) -> bool:
+        """Mark this stream as seekable if the compressed stream is."""
+        return self.source.seekable()
+
+    def close(self) -> None:
+        """Close the reader and the source reader."""
+        try:
+            self.buffer.close()
+        finally:
+            self.source.close()
+
+
+class CompressingStreamerWriter(base_stream.StreamerWriter):
+    """Writer compressing the contents into another binary writer as they are written.
+
+    With more than one thread the contents are split in blocks of block_size bytes that
+    are compressed in parallel.
+    """
+
+    def __init__(
+        self,
+        destination: base_stream.StreamerWriter,
+        codec: Codec,
+        encoding: Optional[str] = None,
+        threads: int = 1,
+        block_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """Create a writer compressing into destination, encoding text if encoding is set."""
+        self.destination = destination
+        buffer: IO
+        if threads > 1:
+            compressor = _ParallelCompressor(codec, destination, threads, block_size)
+            buffer = io.BufferedWriter(compressor, buffer_size=block_size)
+        else:
+            buffer = codec.open_writer(destination)
+        if encoding is not None:
+            buffer = io.TextIOWrapper(buffer, encoding=encoding)
+        super().__init__(destination.client, buffer)
+
+    def seekable(self) -> bool:
+        """Mark this stream as not seekable."""
+        return False
+
+    def discard(self) -> None:
+        """Close the codec and discard the contents of the destination."""
+        self.buffer.close()
+        self.destination.discard()
+
+    def _flush(self):
+        # closing the codec writes the end of the compressed stream
+        self.buffer.close()
+        self.destination.close()
+
+    def _close_unflushed(self):
+        self.buffer.close()
+        self.destination._close_unflushed()
@@ -0,0 +1,150 @@
+"""Readers and writers working straight on local files.
+
+Local files don't need the atomic connections remote clients use, so rather than copying
+the contents into intermediate buffers these streams wrap the os file objects.
+"""
+import io
+import mmap
+import os
+import shutil
+import uuid
+from typing import IO, ContextManager, Optional, Protocol
+
+from . import base_stream
+
+
+__all__ = ["FileOpener", "FileStreamerReader", "FileStreamerWriter"]
+
+
+class FileOpener(Protocol):
+    """Interface for clients backed by local files."""
+
+    path: str
+
+    def open_file(self, mode: str = "rb") -> IO[bytes]:
+        """Open the file in binary mode returning the os file object."""
+        ...
+
+
+class FileStreamerContextManager(
+    FileOpener, base_stream.StreamerContextManager, ContextManager, Protocol
+):
+    """Interface for file based clients within context managers."""
+
+    ...
+
+
+class FileStreamerReader(base_stream.StreamerReader):
+    """Reader backed by the os file, the contents are not copied into a buffer.
+
+    Besides the usual reader methods it exposes `fileno` and a memory mapped `getbuffer` so
+    parsers such as pandas or pyarrow can read the file without duplicating it in memory.
+    """
+
+    client: FileStreamerContextManager
+    file: IO[bytes]
+
+    def __init__(self, client: FileStreamerContextManager, encoding: Optional[str] = None):
+        """Create a reader over the client file, decoded as text if encoding is set."""
+        self.file = client.open_file("rb")
+        self.encoding = encoding
+        self._mmap: Optional[mmap.mmap] = None
+        buffer: IO = self.file
+        if encoding is not None:
+            buffer = io.TextIOWrapper(self.file, encoding=encoding)
+        super().__init__(client, buffer)
+
+    def _load(self):
+        # the contents are read straight from the file
+        ...
+
+    def fileno(self) -> int:
+        """Return the os file descriptor."""
+        return self.file.fileno()
+
+    def getbuffer(self) -> memoryview:
+        """Return a read only view of the whole file backed by a memory map."""
+        if self._mmap is None:
+            if os.fstat(self.file.fileno()).st_size == 0:
+                # empty files can't be mapped
+                return memoryview(b"")
+            self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._mmap)
+
+    def close(self) -> None:
+        """Close the file and the memory map."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # views of the map are still alive, it'll be released with them
+                pass
+        self.buffer.close()
+
+
+class _AtomicFile(io.BufferedWriter):
+    """Binary file written under a temporary name and moved into place when committed.
+
+    The temporary file lives in the destination directory so the final rename is atomic,
+    readers never see a half written file. Closing without committing discards it.
+    """
+
+    temp_path: Optional[str] = None
+    committed = False
+
+    def __init__(self, path: str):
+        # write through symlinks rather than replacing them with a regular file
+        self.path = os.path.realpath(path)
+        directory, name = os.path.split(self.path)
+        temp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        # same permissions as a regular open, umask included
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        fd = os.open(temp_path, flags, 0o666)
+        self.temp_path = temp_path
+        super().__init__(io.FileIO(fd, "w"))
+
+    def commit(self) -> None:
+        """Close the temporary file and move it to the destination path."""
+        assert self.temp_path is not None
+        if os.path.exists(self.path):
+            shutil.copymode(self.path, self.temp_path)
+        super().close()
+        os.replace(self.temp_path, self.path)
+        self.committed = True
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        if not self.committed and self.temp_path is not None:
+            os.remove(self.temp_path)
+
+
+class FileStreamerWriter(base_stream.StreamerWriter):
+    """Writer streaming the contents straight to disk.
+
+    The data is written to a temporary file next to the destination that replaces it when
+    the writer is closed, so memory usage is constant and the file is updated atomically.
+    """
+
+    file: _AtomicFile
+
+    def __init__(self, client: FileStreamerContextManager, encoding: Optional[str] = None):
+        """Create a writer for the client file, encoding text if encoding is set."""
+        self.file = _AtomicFile(client.path)
+        buffer: IO = self.file
+        if encoding is not None:
+            buffer = io.TextIOWrapper(self.file, encoding=encoding)
+        super().__init__(client, buffer)
+
+    def fileno(self) -> int:
+        """Return the os file descriptor of the temporary file."""
+        return self.file.fileno()
+
+    def discard(self) -> None:
+        """Close the writer removing the temporary file, the destination is left untouched."""
+        self.buffer.close()
+
+    def _flush(self):
+        self.buffer.flush()
+        self.file.commit()
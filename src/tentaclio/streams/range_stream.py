@@ -0,0 +1,160 @@
+"""Random access readers fetching byte ranges of the resource on demand.
+
+Columnar formats such as parquet or orc seek to the footer and then read a handful of
+column chunks. Loading the full resource upfront is wasteful in those cases, so these readers
+translate `seek`/`read` into range requests to the client and keep the most recently used
+blocks in a small cache.
+"""
+import abc
+import collections
+import io
+from typing import IO, ContextManager, Optional, Protocol
+
+from tentaclio.clients.base_client import DEFAULT_CHUNK_SIZE
+
+from . import base_stream
+
+
+__all__ = ["RangeStreamer", "RangeStreamerReader"]
+
+# blocks kept in memory by range readers
+DEFAULT_CACHE_BLOCKS = 16
+
+
+class RangeStreamer(Protocol):
+    """Interface for connections able to read arbitrary byte ranges of the resource."""
+
+    @abc.abstractmethod
+    def get_size(self, **params) -> int:
+        """Return the size in bytes of the resource."""
+        ...
+
+    @abc.abstractmethod
+    def get_range(self, offset: int, length: int, **params) -> bytes:
+        """Return length bytes of the resource starting at offset."""
+        ...
+
+
+class RangeStreamerContextManager(
+    RangeStreamer, base_stream.StreamerContextManager, ContextManager, Protocol
+):
+    """Interface for range based connections within context managers."""
+
+    ...
+
+
+class _RangeIO(io.RawIOBase):
+    """Seekable raw stream reading blocks of the resource on demand.
+
+    Reads bigger than the block size go straight to the client, smaller ones are served
+    from a least recently used cache of blocks.
+    """
+
+    def __init__(self, client: RangeStreamer, block_size: int, cache_blocks: int):
+        self.client = client
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self.blocks: collections.OrderedDict = collections.OrderedDict()
+        self._size: Optional[int] = None
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            self._size = self.client.get_size()
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, b) -> int:
+        length = min(len(b), self.size - self._position)
+        if length <= 0:
+            return 0
+
+        if length > self.block_size:
+            data = self.client.get_range(self._position, length)
+            b[: len(data)] = data
+            self._position += len(data)
+            return len(data)
+
+        copied = 0
+        while copied < length:
+            index, start = divmod(self._position, self.block_size)
+            end = start + length - copied
+            piece = memoryview(self._block(index))[start:end]
+            if not piece:
+                break
+            b[copied:copied + len(piece)] = piece
+            copied += len(piece)
+            self._position += len(piece)
+        return copied
+
+    def _block(self, index: int) -> bytes:
+        if index in self.blocks:
+            self.blocks.move_to_end(index)
+            return self.blocks[index]
+
+        offset = index * self.block_size
+        block = self.client.get_range(offset, min(self.block_size, self.size - offset))
+        self.blocks[index] = block
+        if len(self.blocks) > self.cache_blocks:
+            self.blocks.popitem(last=False)
+        return block
+
+
+class RangeStreamerReader(base_stream.StreamerReader):
+    """Seekable reader that fetches only the parts of the resource being read.
+
+    The client connection is kept open until the reader is closed.
+    """
+
+    client: RangeStreamerContextManager
+
+    def __init__(
+        self,
+        client: RangeStreamerContextManager,
+        block_size: int = DEFAULT_CHUNK_SIZE,
+        cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+        encoding: Optional[str] = None,
+    ):
+        """Create a reader fetching blocks of block_size bytes.
+
+        The contents are decoded as text if encoding is set.
+        """
+        self.raw = _RangeIO(client, block_size, cache_blocks)
+        buffer: IO = io.BufferedReader(self.raw)
+        if encoding is not None:
+            buffer = io.TextIOWrapper(buffer, encoding=encoding)
+        super().__init__(client, buffer)
+
+    def _load(self):
+        # the blocks are fetched on demand, just connect
+        self.client.__enter__()
+
+    def close(self) -> None:
+        """Close the reader and the client connection."""
+        try:
+            self.buffer.close()
+        finally:
+            self.client.__exit__(None, None, None)
@@ -1,9 +1,17 @@
 """Base handler."""
 import io
 import logging
-from typing import Callable
+import os
+from typing import IO, Callable, Optional, Tuple, cast
 
-from tentaclio.streams import base_stream
+from tentaclio.streams import (
+    base_stream,
+    buffers,
+    cache,
+    compression,
+    local_stream,
+    range_stream,
+)
 from tentaclio.urls import URL
 
 
@@ -11,7 +19,22 @@ logger = logging.getLogger(__name__)
 
 StreamerFactory = Callable[..., base_stream.StreamerContextManager]
 
-__all__ = ["StreamURLHandler"]
+__all__ = ["StreamURLHandler", "LocalStreamURLHandler"]
+
+# open kwargs consumed by the handler rather than the client
+STREAM_OPTIONS = (
+    "streaming",
+    "random_access",
+    "cache",
+    "compression",
+    "compression_threads",
+    "chunk_size",
+    "cache_blocks",
+    "spill_threshold",
+)
+
+# size in bytes after which writer buffers are moved to disk
+SPILL_THRESHOLD_ENV = "TENTACLIO__SPILL_THRESHOLD"
 
 
 def _is_bytes_mode(mode: str) -> bool:
@@ -20,6 +43,28 @@ def _is_bytes_mode(mode: str) -> bool:
     return False
 
 
+def _text_encoding(mode: str, extras: dict) -> Optional[str]:
+    """Return the encoding for text modes, None for binary ones."""
+    if _is_bytes_mode(mode):
+        return None
+    return extras.get("encoding", "utf-8")
+
+
+def _split_extras(extras: dict) -> Tuple[dict, dict]:
+    """Separate the stream options from the extras that are forwarded to the client."""
+    options = {key: value for key, value in extras.items() if key in STREAM_OPTIONS}
+    client_extras = {key: value for key, value in extras.items() if key not in STREAM_OPTIONS}
+    return options, client_extras
+
+
+def _writer_buffer(options: dict) -> IO[bytes]:
+    """Create the byte buffer for writers, spilling to disk if a threshold is configured."""
+    threshold = options.get("spill_threshold", os.getenv(SPILL_THRESHOLD_ENV) or None)
+    if threshold is None:
+        return io.BytesIO()
+    return cast(IO[bytes], buffers.SpooledBuffer(int(threshold)))
+
+
 class StreamURLHandler:
     """Handler for opening writers and readers ."""
 
@@ -30,21 +75,142 @@ class StreamURLHandler:
         self.client_factory = client_factory
 
     def open_reader_for(self, url: URL, mode: str, extras: dict) -> base_stream.StreamerReader:
-        """Open an stream client for reading."""
-        client = self.client_factory(url, **extras)
+        """Open an stream client for reading.
 
-        if _is_bytes_mode(mode):
-            return base_stream.StreamerReader(client, io.BytesIO())
-        return base_stream.StringToBytesClientReader(
-            client, encoding=extras.get("encoding", "utf-8")
-        )
+        Passing `streaming=True` returns a forward only reader that pulls the contents
+        from the client as they are consumed, in blocks of `chunk_size` bytes.
+
+        Passing `random_access=True` returns a seekable reader that only fetches the
+        blocks of `chunk_size` bytes being read, keeping the last `cache_blocks` in memory.
+
+        Passing `cache=True` serves the contents from the on-disk STREAM_CACHE while the
+        resource hasn't changed.
+
+        Passing `compression="infer"` decompresses the resources with a compressed extension as
+        they are read, the codec can also be set explicitly. The contents are left as they are
+        by default.
+        """
+        options, client_extras = _split_extras(extras)
+        encoding = _text_encoding(mode, extras)
+        codec = compression.get_codec(url, options.get("compression"))
+        if codec is None:
+            return self._open_reader(url, encoding, options, client_extras)
+
+        source = self._open_reader(url, None, options, client_extras)
+        return compression.DecompressingStreamerReader(source, codec, encoding=encoding)
 
     def open_writer_for(self, url: URL, mode: str, extras: dict) -> base_stream.StreamerWriter:
-        """Open an stream client writing."""
-        client = self.client_factory(url, **extras)
+        """Open an stream client writing.
 
-        if _is_bytes_mode(mode):
-            return base_stream.StreamerWriter(client, io.BytesIO())
+        Passing `streaming=True` returns a writer that uploads the contents, in blocks of
+        `chunk_size` bytes, while they are being written.
+
+        Otherwise the written contents are buffered in memory unless `spill_threshold` (or the
+        TENTACLIO__SPILL_THRESHOLD env variable) is set, in which case the buffer is moved
+        to a temporary file once it grows past that many bytes.
+
+        Passing `compression="infer"` compresses the resources with a compressed extension as
+        they are written, the codec can also be set explicitly. The contents are left as they are
+        by default. With `compression_threads` greater than one, blocks of `chunk_size` bytes are
+        compressed in parallel.
+        """
+        options, client_extras = _split_extras(extras)
+        encoding = _text_encoding(mode, extras)
+        codec = compression.get_codec(url, options.get("compression"))
+        if codec is None:
+            return self._open_writer(url, encoding, options, client_extras)
+
+        destination = self._open_writer(url, None, options, client_extras)
+        return compression.CompressingStreamerWriter(
+            destination,
+            codec,
+            encoding=encoding,
+            threads=options.get("compression_threads", 1),
+            block_size=options.get("chunk_size", base_stream.DEFAULT_CHUNK_SIZE),
+        )
+
+    def _open_reader(
+        self, url: URL, encoding: Optional[str], options: dict, client_extras: dict
+    ) -> base_stream.StreamerReader:
+        """Open a reader of the client contents, decoded as text if encoding is set."""
+        client = self.client_factory(url, **client_extras)
+        chunk_size = options.get("chunk_size", base_stream.DEFAULT_CHUNK_SIZE)
+
+        if options.get("cache"):
+            if hasattr(client, "get_fingerprint"):
+                return cache.STREAM_CACHE.open_reader(
+                    cast(cache.FingerprintStreamerContextManager, client),
+                    url,
+                    encoding=encoding,
+                )
+            logger.warning(f"{type(client).__name__} can't validate cached copies of {url}")
+
+        if options.get("random_access"):
+            if hasattr(client, "get_range"):
+                return range_stream.RangeStreamerReader(
+                    cast(range_stream.RangeStreamerContextManager, client),
+                    block_size=chunk_size,
+                    cache_blocks=options.get("cache_blocks", range_stream.DEFAULT_CACHE_BLOCKS),
+                    encoding=encoding,
+                )
+            logger.warning(f"{type(client).__name__} can't read ranges, loading {url} into memory")
+
+        if options.get("streaming"):
+            if hasattr(client, "iter_chunks"):
+                return base_stream.ChunkedStreamerReader(
+                    cast(base_stream.ChunkStreamerContextManager, client),
+                    chunk_size=chunk_size,
+                    encoding=encoding,
+                )
+            logger.warning(f"{type(client).__name__} can't stream, loading {url} into memory")
+
+        if encoding is None:
+            return base_stream.StreamerReader(client, io.BytesIO())
+        return base_stream.StringToBytesClientReader(client, encoding=encoding)
+
+    def _open_writer(
+        self, url: URL, encoding: Optional[str], options: dict, client_extras: dict
+    ) -> base_stream.StreamerWriter:
+        """Open a writer into the client, encoding text if encoding is set."""
+        client = self.client_factory(url, **client_extras)
+
+        if options.get("streaming"):
+            return base_stream.ChunkedStreamerWriter(
+                client,
+                chunk_size=options.get("chunk_size", base_stream.DEFAULT_CHUNK_SIZE),
+                encoding=encoding,
+            )
+
+        buffer = _writer_buffer(options)
+
+        if encoding is None:
+            return base_stream.StreamerWriter(client, buffer)
         return base_stream.StringToBytesClientWriter(
-            client, encoding=extras.get("encoding", "utf-8")
+            client, encoding=encoding, inner_buffer=buffer
+        )
+
+
+class LocalStreamURLHandler(StreamURLHandler):
+    """Handler for local files.
+
+    Readers wrap the os file rather than loading its contents into memory and writers
+    write straight to disk, replacing the destination atomically when closed.
+    """
+
+    def _open_reader(
+        self, url: URL, encoding: Optional[str], options: dict, client_extras: dict
+    ) -> base_stream.StreamerReader:
+        """Open a reader backed by the local file."""
+        client = self.client_factory(url, **client_extras)
+        return local_stream.FileStreamerReader(
+            cast(local_stream.FileStreamerContextManager, client), encoding=encoding
+        )
+
+    def _open_writer(
+        self, url: URL, encoding: Optional[str], options: dict, client_extras: dict
+    ) -> base_stream.StreamerWriter:
+        """Open a writer backed by a temporary file next to the destination."""
+        client = self.client_factory(url, **client_extras)
+        return local_stream.FileStreamerWriter(
+            cast(local_stream.FileStreamerContextManager, client), encoding=encoding
         )
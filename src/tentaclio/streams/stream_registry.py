@@ -34,7 +34,11 @@ class _WriterContextManager(ContextManager[base_stream.StreamerWriter]):
         return self.resource
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        self.resource.close()
+        if exc_type is not None:
+            # don't commit the contents written before the error
+            self.resource.discard()
+        else:
+            self.resource.close()
 
 
 class StreamHandler(Protocol):
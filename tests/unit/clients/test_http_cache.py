@@ -0,0 +1,118 @@
+import io
+
+import pytest
+
+from tentaclio.clients import http_cache, http_client
+
+
+@pytest.fixture()
+def response_cache(mocker, tmp_path):
+    response_cache = http_cache.HTTPResponseCache(directory=str(tmp_path / "http"), max_size=10)
+    mocker.patch.object(http_cache, "HTTP_CACHE", response_cache)
+    yield response_cache
+
+
+@pytest.fixture()
+def mocked_http_conn(mocker):
+    with mocker.patch.object(http_client.HTTPClient, "_connect", return_value=mocker.Mock()):
+        yield
+
+
+def _response(mocker, status_code=200, body=b"", headers=None):
+    response = mocker.MagicMock(status_code=status_code, headers=headers or {})
+    response.iter_content.return_value = iter([body])
+    return response
+
+
+def _get(client, **kwargs) -> bytes:
+    buff = io.BytesIO()
+    with client:
+        client.get(buff, **kwargs)
+    return buff.getvalue()
+
+
+class TestHTTPResponseCache:
+    def test_store_and_read(self, response_cache):
+        key = http_cache.cache_key("http://host.com/request")
+        chunks = response_cache.store(key, {"etag": '"v1"'}, iter([b"hel", b"lo"]))
+
+        assert list(chunks) == [b"hel", b"lo"]
+        assert response_cache.lookup(key)["etag"] == '"v1"'
+        buff = io.BytesIO()
+        assert response_cache.read_into(key, buff)
+        assert buff.getvalue() == b"hello"
+
+    def test_interrupted_store(self, response_cache):
+        key = http_cache.cache_key("http://host.com/request")
+        chunks = response_cache.store(key, {"etag": '"v1"'}, iter([b"hel", b"lo"]))
+        next(chunks)
+        chunks.close()
+
+        assert response_cache.lookup(key) is None
+        assert not response_cache.read_into(key, io.BytesIO())
+
+    def test_lru_eviction(self, response_cache):
+        first, second, third = (http_cache.cache_key(f"http://host.com/{i}") for i in range(3))
+        list(response_cache.store(first, {}, [b"1111"]))
+        list(response_cache.store(second, {}, [b"2222"]))
+        response_cache.read_into(first, io.BytesIO())
+        # the cache can only fit two entries, the second url is the least recently used
+        list(response_cache.store(third, {}, [b"3333"]))
+
+        assert response_cache.lookup(first) is not None
+        assert response_cache.lookup(second) is None
+
+    def test_users_keys(self):
+        url = "http://host.com/request"
+        assert http_cache.cache_key(url, "user") != http_cache.cache_key(url, "other")
+
+
+class TestConditionalGet:
+    def test_not_modified(self, response_cache, mocked_http_conn, mocker):
+        client = http_client.HTTPClient("http://host.com/request", http_cache=True)
+        client._send_request = mocker.MagicMock(
+            return_value=_response(mocker, body=b"hello", headers={"ETag": '"v1"'})
+        )
+        assert _get(client) == b"hello"
+
+        client._send_request.return_value = _response(mocker, status_code=304)
+        assert _get(client) == b"hello"
+
+        headers = client.conn.prepare_request.call_args.args[0].headers
+        assert headers["If-None-Match"] == '"v1"'
+
+    def test_modified(self, response_cache, mocked_http_conn, mocker):
+        client = http_client.HTTPClient("http://host.com/request", http_cache=True)
+        client._send_request = mocker.MagicMock(
+            return_value=_response(mocker, body=b"hello", headers={"Last-Modified": "Mon"})
+        )
+        assert _get(client) == b"hello"
+
+        client._send_request.return_value = _response(
+            mocker, body=b"world", headers={"Last-Modified": "Tue"}
+        )
+        assert _get(client) == b"world"
+
+        headers = client.conn.prepare_request.call_args.args[0].headers
+        assert headers["If-Modified-Since"] == "Mon"
+        key = http_cache.cache_key(str(client.conn.prepare_request.return_value.url))
+        assert response_cache.lookup(key)["last_modified"] == "Tue"
+
+    def test_no_validators(self, response_cache, mocked_http_conn, mocker):
+        client = http_client.HTTPClient("http://host.com/request", http_cache=True)
+        client._send_request = mocker.MagicMock(return_value=_response(mocker, body=b"hello"))
+        assert _get(client) == b"hello"
+
+        client._send_request.return_value = _response(mocker, body=b"hello")
+        assert _get(client) == b"hello"
+
+        assert "If-None-Match" not in client.conn.prepare_request.call_args.args[0].headers
+
+    def test_ttl(self, response_cache, mocked_http_conn, mocker):
+        client = http_client.HTTPClient("http://host.com/request", http_cache=True, cache_ttl=60)
+        client._send_request = mocker.MagicMock(return_value=_response(mocker, body=b"hello"))
+
+        assert _get(client) == b"hello"
+        assert _get(client) == b"hello"
+
+        client._send_request.assert_called_once()
@@ -0,0 +1,84 @@
+import io
+import threading
+
+import pytest
+
+from tentaclio.clients import exceptions, http_client, http_hedging
+
+
+@pytest.fixture()
+def policy(mocker):
+    policy = http_hedging.HedgingPolicy(initial_delay=0.01, max_workers=4)
+    mocker.patch.object(http_hedging, "HTTP_HEDGING", policy)
+    yield policy
+
+
+class SlowFirstCall:
+    """Send function whose first call blocks until released."""
+
+    def __init__(self, mocker):
+        self.release = threading.Event()
+        self.responses = [mocker.MagicMock(name="slow"), mocker.MagicMock(name="fast")]
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            call = self.calls
+            self.calls += 1
+        if call == 0:
+            self.release.wait(5)
+        return self.responses[call]
+
+
+class TestHedgingPolicy:
+    def test_fast_response(self, policy, mocker):
+        response = mocker.MagicMock()
+
+        assert policy.send("host", lambda: response) is response
+        assert policy.stats() == http_hedging.HedgingStats(requests=1, hedges=0, hedge_wins=0)
+
+    def test_hedge_wins(self, policy, mocker):
+        send = SlowFirstCall(mocker)
+
+        assert policy.send("host", send) is send.responses[1]
+        send.release.set()
+        policy._get_executor().shutdown(wait=True)
+
+        send.responses[0].close.assert_called_once()
+        assert policy.stats() == http_hedging.HedgingStats(requests=1, hedges=1, hedge_wins=1)
+
+    def test_failed_hedge(self, policy, mocker):
+        send = SlowFirstCall(mocker)
+        send.responses[1] = None
+
+        def failing_hedge():
+            response = send()
+            if response is None:
+                raise exceptions.HTTPError("503: Service Unavailable")
+            return response
+
+        threading.Timer(0.05, send.release.set).start()
+        assert policy.send("host", failing_hedge) is send.responses[0]
+        assert policy.stats() == http_hedging.HedgingStats(requests=1, hedges=1, hedge_wins=0)
+
+    def test_percentile_delay(self, policy, mocker):
+        policy.configure(percentile=50, initial_delay=1.0)
+        for _ in range(20):
+            policy.send("host", mocker.MagicMock)
+
+        assert policy.delay("host") < policy.initial_delay
+        assert policy.delay("other") == policy.initial_delay
+
+
+def test_hedged_get(policy, mocker):
+    mocker.patch.object(http_client.HTTPClient, "_connect", return_value=mocker.Mock())
+    with http_client.HTTPClient("http://host.com/endpoint", hedge=True) as client:
+        response = mocker.MagicMock()
+        response.iter_content.return_value = iter([b"hello"])
+        client._send_request = mocker.MagicMock(return_value=response)
+        buff = io.BytesIO()
+        client.get(buff)
+
+    assert buff.getvalue() == b"hello"
+    assert policy.stats().requests == 1
@@ -1,4 +1,5 @@
 import collections
+import io
 
 from tentaclio import URL
 from tentaclio.clients.local_fs_client import LocalFSClient
@@ -34,3 +35,20 @@ class TestLocalFileScanner(object):
             assert entry.url == expected.url
             assert entry.is_dir == expected.is_dir
             assert entry.is_file == expected.is_file
+
+
+def test_iter_chunks(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"hello")
+
+    chunks = list(LocalFSClient(str(path)).iter_chunks(chunk_size=2))
+
+    assert chunks == [b"he", b"ll", b"o"]
+
+
+def test_put(tmp_path):
+    path = tmp_path / "file.txt"
+
+    LocalFSClient(str(path)).put(io.BytesIO(b"hello"))
+
+    assert path.read_bytes() == b"hello"
@@ -0,0 +1,122 @@
+import time
+
+from tentaclio.clients import pool
+
+
+class FakeConnection:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.closed = False
+
+    def is_alive(self):
+        return self.alive
+
+    def close(self):
+        self.closed = True
+
+
+def is_alive(conn):
+    return conn.is_alive()
+
+
+def close(conn):
+    conn.close()
+
+
+def test_acquire_released_connection():
+    connection_pool = pool.ConnectionPool(max_size=2)
+    conn = FakeConnection()
+    assert connection_pool.acquire("key", is_alive) is None
+
+    connection_pool.release("key", conn, close)
+
+    assert connection_pool.acquire("other", is_alive) is None
+    assert connection_pool.acquire("key", is_alive) is conn
+    assert connection_pool.acquire("key", is_alive) is None
+
+
+def test_max_size():
+    connection_pool = pool.ConnectionPool(max_size=1)
+    first, second = FakeConnection(), FakeConnection()
+
+    connection_pool.release("key", first, close)
+    connection_pool.release("key", second, close)
+
+    assert connection_pool.size("key") == 1
+    assert second.closed
+
+
+def test_disabled_pool():
+    connection_pool = pool.ConnectionPool(max_size=0)
+    conn = FakeConnection()
+
+    connection_pool.release("key", conn, close)
+
+    assert conn.closed
+    assert connection_pool.acquire("key", is_alive) is None
+
+
+def test_broken_connections_are_discarded():
+    connection_pool = pool.ConnectionPool(max_size=2)
+    healthy, broken = FakeConnection(), FakeConnection(alive=False)
+    connection_pool.release("key", healthy, close)
+    connection_pool.release("key", broken, close)
+
+    assert connection_pool.acquire("key", is_alive) is healthy
+    assert broken.closed
+
+
+def test_failing_health_check():
+    connection_pool = pool.ConnectionPool(max_size=2)
+    conn = FakeConnection()
+    connection_pool.release("key", conn, close)
+
+    def raise_error(conn):
+        raise EOFError()
+
+    assert connection_pool.acquire("key", raise_error) is None
+    assert conn.closed
+
+
+def test_idle_timeout():
+    connection_pool = pool.ConnectionPool(max_size=2, idle_timeout=0.01)
+    conn = FakeConnection()
+    connection_pool.release("key", conn, close)
+
+    time.sleep(0.02)
+
+    assert connection_pool.acquire("key", is_alive) is None
+    assert conn.closed
+
+
+def test_clear():
+    connection_pool = pool.ConnectionPool(max_size=2)
+    conn = FakeConnection()
+    connection_pool.release("key", conn, close)
+
+    connection_pool.clear()
+
+    assert conn.closed
+    assert connection_pool.size() == 0
+
+
+def test_env_settings(monkeypatch):
+    monkeypatch.setenv(pool.POOL_MAX_SIZE_ENV, "7")
+    monkeypatch.setenv(pool.POOL_IDLE_TIMEOUT_ENV, "1.5")
+
+    connection_pool = pool.ConnectionPool()
+
+    assert connection_pool.max_size == 7
+    assert connection_pool.idle_timeout == 1.5
+
+
+def test_reaper():
+    connection_pool = pool.ConnectionPool(max_size=2, idle_timeout=0.01)
+    conn = FakeConnection()
+    connection_pool.release("key", conn, close)
+
+    time.sleep(0.2)
+
+    # closed without the pool being used again
+    assert conn.closed
+    assert connection_pool.size() == 0
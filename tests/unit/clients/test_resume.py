@@ -0,0 +1,101 @@
+import io
+
+import pytest
+
+from tentaclio.clients import resume
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(mocker):
+    mocker.patch.object(resume, "BACKOFF", 0)
+
+
+class FlakyTransfer:
+    def __init__(self, failures, recover_failures=0):
+        self.failures = failures
+        self.recover_failures = recover_failures
+        self.calls = 0
+        self.recovered = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("connection reset by peer")
+
+    def recover(self):
+        self.recovered += 1
+        if self.recovered <= self.recover_failures:
+            raise ConnectionError("connection refused")
+
+
+def test_retry_transfer():
+    transfer = FlakyTransfer(failures=2)
+
+    resume.retry_transfer(transfer, 2, (ConnectionError,), transfer.recover, "test")
+
+    assert transfer.calls == 3
+    assert transfer.recovered == 2
+
+
+def test_retry_budget_exhausted():
+    transfer = FlakyTransfer(failures=2)
+
+    with pytest.raises(ConnectionError):
+        resume.retry_transfer(transfer, 1, (ConnectionError,), transfer.recover, "test")
+
+    assert transfer.calls == 2
+
+
+def test_failed_recover_retried():
+    transfer = FlakyTransfer(failures=1, recover_failures=1)
+
+    resume.retry_transfer(transfer, 2, (ConnectionError,), transfer.recover, "test")
+
+    assert transfer.calls == 2
+    assert transfer.recovered == 2
+
+
+def test_failed_recover_uses_budget():
+    transfer = FlakyTransfer(failures=1, recover_failures=2)
+
+    with pytest.raises(ConnectionError, match="refused"):
+        resume.retry_transfer(transfer, 2, (ConnectionError,), transfer.recover, "test")
+
+    assert transfer.calls == 1
+
+
+def test_other_errors_not_retried():
+    transfer = FlakyTransfer(failures=1)
+
+    with pytest.raises(ConnectionError):
+        resume.retry_transfer(transfer, 3, (TimeoutError,), transfer.recover, "test")
+
+    assert transfer.recovered == 0
+
+
+@pytest.mark.parametrize(
+    "retries,query,env,expected",
+    [
+        (None, None, None, 0),
+        (2, {"retries": "3"}, "4", 2),
+        (None, {"retries": "3"}, "4", 3),
+        (None, {}, "4", 4),
+    ],
+)
+def test_retry_budget(retries, query, env, expected, monkeypatch):
+    if env is not None:
+        monkeypatch.setenv(resume.RETRIES_ENV, env)
+    else:
+        monkeypatch.delenv(resume.RETRIES_ENV, raising=False)
+
+    assert resume.retry_budget(retries, query) == expected
+
+
+def test_counting_writer():
+    buff = io.BytesIO()
+    writer = resume.CountingWriter(buff)
+    writer.write(b"hel")
+    writer.write(b"lo")
+
+    assert writer.offset == 5
+    assert buff.getvalue() == b"hello"
@@ -1,6 +1,12 @@
+import errno
 import io
+import os
+import shutil
 
-from tentaclio.fs import DefaultCopier
+import pytest
+
+from tentaclio import COPIER_REGISTRY, URL
+from tentaclio.fs import DefaultCopier, LocalCopier
 
 
 def test_copy(mocker):
@@ -12,3 +18,59 @@ def test_copy(mocker):
     DefaultCopier().copy(orig, dest)
     dest.seek(0)
     assert dest.getvalue() == "contents"
+
+
+@pytest.fixture()
+def local_files(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"\x00contents" * 1000)
+    return source, tmp_path / "dest.bin"
+
+
+def test_local_copy(local_files):
+    source, dest = local_files
+    LocalCopier().copy(URL(str(source)), URL("file://" + str(dest)))
+
+    assert dest.read_bytes() == source.read_bytes()
+    # no temporary files left behind
+    assert sorted(os.listdir(dest.parent)) == ["dest.bin", "source.bin"]
+
+
+@pytest.mark.parametrize("unsupported", ["ioctl", "copy_file_range"])
+def test_local_copy_fallback(local_files, unsupported, mocker):
+    source, dest = local_files
+    dest.write_bytes(b"old contents")
+    error = OSError(errno.EXDEV, "Invalid cross-device link")
+    mocker.patch("fcntl.ioctl", side_effect=error)
+    if unsupported == "copy_file_range":
+        mocker.patch("os.copy_file_range", side_effect=error, create=True)
+    copyfile = mocker.spy(shutil, "copyfile")
+
+    LocalCopier().copy(URL(str(source)), URL(str(dest)))
+
+    assert dest.read_bytes() == source.read_bytes()
+    assert copyfile.called == (unsupported == "copy_file_range")
+
+
+def test_local_copy_symlink(local_files):
+    source, dest = local_files
+    dest.write_bytes(b"old contents")
+    link = dest.parent / "link.bin"
+    link.symlink_to(dest)
+
+    LocalCopier().copy(URL(str(source)), URL(str(link)))
+
+    assert link.is_symlink()
+    assert dest.read_bytes() == source.read_bytes()
+
+
+def test_local_copy_missing_source(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LocalCopier().copy(URL(str(tmp_path / "missing")), URL(str(tmp_path / "dest")))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_local_copier_registered():
+    assert isinstance(COPIER_REGISTRY.get_handler("file+"), LocalCopier)
+    assert isinstance(COPIER_REGISTRY.get_handler("+"), LocalCopier)
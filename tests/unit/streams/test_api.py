@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from tentaclio.streams import api
@@ -40,3 +42,67 @@ def test_make_empty_safe(mocker):
     wrapped = api.make_empty_safe(writer)
     with wrapped as w:
         assert not w.dirty
+
+
+@pytest.fixture
+def fake_files(tmp_path):
+    urls = []
+    for i in range(10):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(str(i))
+        urls.append(str(path))
+    return urls
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_open_many(fake_files, ordered):
+    results = {}
+    for url, reader in api.open_many(fake_files, max_workers=3, ordered=ordered):
+        with reader:
+            results[url] = reader.read()
+
+    assert results == {url: str(i) for i, url in enumerate(fake_files)}
+    if ordered:
+        assert list(results) == fake_files
+
+
+def test_open_many_errors(fake_files):
+    urls = fake_files[:2] + ["/not/a/file.txt"]
+
+    results = dict(api.open_many(urls, ordered=True, return_exceptions=True))
+    assert isinstance(results["/not/a/file.txt"], FileNotFoundError)
+    for url in fake_files[:2]:
+        results[url].close()
+
+    with pytest.raises(FileNotFoundError):
+        for _, reader in api.open_many(urls, ordered=True):
+            reader.close()
+
+
+def test_open_many_closes_pending_readers(fake_files, mocker):
+    readers = []
+    original = api._open_reader_resource
+
+    def open_reader_resource(*args):
+        reader = original(*args)
+        readers.append(reader)
+        return reader
+
+    mocker.patch.object(api, "_open_reader_resource", side_effect=open_reader_resource)
+
+    results = api.open_many(fake_files, max_workers=2, ordered=True)
+    _, reader = next(results)
+    reader.close()
+    results.close()
+
+    # only the window of max_workers * 2 readers was opened
+    assert len(readers) <= 5
+    deadline = time.monotonic() + 5
+    while not all(reader.closed for reader in readers) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert all(reader.closed for reader in readers)
+
+
+def test_open_many_write_mode():
+    with pytest.raises(ValueError):
+        api.open_many(["file.txt"], mode="w")
@@ -1,6 +1,9 @@
 import io
+import threading
 
-from tentaclio.streams import base_stream
+import pytest
+
+from tentaclio.streams import api, base_stream, stream_registry
 
 
 class TestStreamerWriter:
@@ -22,6 +25,17 @@ class TestStreamerWriter:
         assert buff.closed
         client.put.assert_called()
 
+    def test_io_surface(self, mocker):
+        buff = io.BytesIO()
+
+        with base_stream.StreamerWriter(mocker.MagicMock(), buff) as writer:
+            assert writer.writable() and not writer.readable()
+            assert not writer.closed
+            writer.writelines([b"hello\n", b"world\n"])
+            assert buff.getvalue() == b"hello\nworld\n"
+
+        assert writer.closed
+
 
 class TestDirtyStreamerWriter:
     def test_write_dirty(self, mocker):
@@ -44,6 +58,18 @@ class TestDirtyStreamerWriter:
         assert buff.closed
         client.put.assert_not_called()
 
+    def test_raise_clean(self, mocker):
+        client = mocker.MagicMock()
+        buff = io.StringIO()
+
+        writer = stream_registry._WriterContextManager(base_stream.StreamerWriter(client, buff))
+        with pytest.raises(ValueError):
+            with api.make_empty_safe(writer):
+                raise ValueError("failed")
+
+        assert buff.closed
+        client.put.assert_not_called()
+
 
 class TestStreamerReader:
     def test_read(self, mocker):
@@ -78,3 +104,164 @@ class TestStreamerReader:
 
         reader = base_stream.StreamerReader(client, io.BytesIO())
         assert reader.seekable()
+
+    def test_io_surface(self, mocker):
+        client = mocker.MagicMock()
+        client.get = lambda f: f.write(b"hello\nworld\n")
+
+        with base_stream.StreamerReader(client, io.BytesIO()) as reader:
+            assert reader.readable() and not reader.writable()
+            assert not reader.closed
+            b = bytearray(3)
+            assert reader.readinto(b) == 3
+            assert b == b"hel"
+            assert reader.readinto1(b) == 3
+            assert reader.read1(2) == b"wo"
+            assert reader.readlines() == [b"rld\n"]
+
+        assert reader.closed
+
+    def test_getbuffer(self, mocker):
+        client = mocker.MagicMock()
+        client.get = lambda f: f.write(b"hello")
+
+        reader = base_stream.StreamerReader(client, io.BytesIO())
+        view = reader.getbuffer()
+        assert view.readonly
+        assert bytes(view) == b"hello"
+        # closing with an alive view doesn't fail
+        reader.close()
+
+    def test_binary_methods_in_text_mode(self, mocker):
+        client = mocker.MagicMock()
+        client.get = lambda f: f.write(b"hello")
+
+        reader = base_stream.StringToBytesClientReader(client)
+        with pytest.raises(io.UnsupportedOperation):
+            reader.readinto(bytearray(3))
+        with pytest.raises(io.UnsupportedOperation):
+            reader.getbuffer()
+        with pytest.raises(io.UnsupportedOperation):
+            reader.fileno()
+
+
+class TestChunkedStreamerReader:
+    def test_read(self, mocker):
+        client = mocker.MagicMock()
+        client.iter_chunks.return_value = iter([b"hello ", b"world"])
+
+        reader = base_stream.ChunkedStreamerReader(client, chunk_size=4)
+        assert reader.read() == b"hello world"
+
+    def test_pulls_chunks_lazily(self, mocker):
+        client = mocker.MagicMock()
+        chunks = iter([b"hello\n", b"world\n"])
+        client.iter_chunks.return_value = chunks
+
+        reader = base_stream.ChunkedStreamerReader(client, chunk_size=4)
+        assert reader.readline() == b"hello\n"
+        assert next(chunks) == b"world\n"
+
+    def test_read_text(self, mocker):
+        client = mocker.MagicMock()
+        client.iter_chunks.return_value = iter(["👋 🐙".encode("utf-8")[:3], "👋 🐙".encode()[3:]])
+
+        reader = base_stream.ChunkedStreamerReader(client, encoding="utf-8")
+        assert reader.read() == "👋 🐙"
+
+    def test_close(self, mocker):
+        client = mocker.MagicMock()
+
+        def chunks(chunk_size):
+            try:
+                yield b"hello"
+            finally:
+                client.released = True
+
+        client.iter_chunks = chunks
+        reader = base_stream.ChunkedStreamerReader(client)
+        reader.read(1)
+        reader.close()
+
+        assert reader.buffer.closed
+        assert client.released
+        client.__enter__.assert_called_once()
+        client.__exit__.assert_called_once()
+
+    def test_not_seekable(self, mocker):
+        client = mocker.MagicMock()
+
+        reader = base_stream.ChunkedStreamerReader(client)
+        assert not reader.seekable()
+
+
+class UploadRecorder:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.uploaded = io.BytesIO()
+        self.entered = threading.Event()
+
+    def __enter__(self):
+        self.entered.set()
+        return self
+
+    def __exit__(self, *args):
+        ...
+
+    def put(self, reader):
+        if self.fail:
+            raise IOError("connection refused")
+        while True:
+            chunk = reader.read(2)
+            if not chunk:
+                break
+            self.uploaded.write(chunk)
+
+
+class TestChunkedStreamerWriter:
+    def test_write(self):
+        client = UploadRecorder()
+
+        writer = base_stream.ChunkedStreamerWriter(client, chunk_size=4)
+        writer.write(b"hello")
+        assert client.entered.wait(timeout=5)
+        writer.write(b" world")
+        writer.close()
+
+        assert client.uploaded.getvalue() == b"hello world"
+        assert writer.buffer.closed
+
+    def test_write_text(self):
+        client = UploadRecorder()
+
+        writer = base_stream.ChunkedStreamerWriter(client, chunk_size=4, encoding="utf-8")
+        writer.write("👋 🐙")
+        writer.close()
+
+        assert client.uploaded.getvalue() == "👋 🐙".encode("utf-8")
+
+    def test_close_empty(self):
+        client = UploadRecorder()
+
+        writer = base_stream.ChunkedStreamerWriter(client)
+        writer.close()
+
+        assert client.entered.is_set()
+        assert client.uploaded.getvalue() == b""
+
+    def test_upload_error(self):
+        client = UploadRecorder(fail=True)
+
+        writer = base_stream.ChunkedStreamerWriter(client, chunk_size=1, max_pending_chunks=1)
+        with pytest.raises(IOError, match="connection refused"):
+            for _ in range(100):
+                writer.write(b"hello")
+            writer.close()
+
+    def test_dirty_writer_clean(self):
+        client = UploadRecorder()
+
+        writer = base_stream.DirtyStreamerWriter(base_stream.ChunkedStreamerWriter(client))
+        writer.close()
+
+        assert not client.entered.is_set()
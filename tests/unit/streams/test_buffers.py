@@ -0,0 +1,52 @@
+import io
+
+import pytest
+
+from tentaclio.streams import buffers
+
+
+class TestSpooledBuffer:
+    def test_stays_in_memory(self):
+        buff = buffers.SpooledBuffer(max_size=10)
+        buff.write(b"hello")
+
+        assert not buff.rolled
+        buff.seek(0)
+        assert buff.read() == b"hello"
+
+    def test_rolls_over(self):
+        buff = buffers.SpooledBuffer(max_size=4)
+        buff.write(b"hello")
+        buff.write(b" world")
+
+        assert buff.rolled
+        assert buff.tell() == 11
+        buff.seek(0)
+        assert buff.read() == b"hello world"
+
+    def test_fileno(self):
+        buff = buffers.SpooledBuffer(max_size=10)
+        buff.write(b"hello")
+
+        with pytest.raises(io.UnsupportedOperation):
+            buff.fileno()
+        assert not buff.rolled
+
+        buff.write(b" world")
+        assert isinstance(buff.fileno(), int)
+
+    def test_text_wrapper(self):
+        buff = buffers.SpooledBuffer(max_size=2)
+        text = io.TextIOWrapper(buff, encoding="utf-8")
+        text.write("👋 🐙")
+        text.seek(0)
+
+        assert buff.rolled
+        assert buff.read() == "👋 🐙".encode("utf-8")
+
+    def test_close(self):
+        buff = buffers.SpooledBuffer(max_size=2)
+        buff.write(b"hello")
+        buff.close()
+
+        assert buff.closed
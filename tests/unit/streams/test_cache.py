@@ -0,0 +1,96 @@
+import pytest
+
+from tentaclio import URL
+from tentaclio.streams import cache
+
+
+class FingerprintRecorder:
+    def __init__(self, contents: bytes, fingerprint="v1"):
+        self.contents = contents
+        self.fingerprint = fingerprint
+        self.downloads = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        ...
+
+    def get_fingerprint(self):
+        return self.fingerprint
+
+    def get(self, writer):
+        self.downloads += 1
+        writer.write(self.contents)
+
+
+def _read(reader):
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+@pytest.fixture
+def stream_cache(tmp_path):
+    return cache.StreamCache(directory=str(tmp_path / "cache"), max_size=10)
+
+
+def test_read_through(stream_cache):
+    client = FingerprintRecorder(b"hello")
+    url = URL("sftp://host/file.txt")
+
+    assert _read(stream_cache.open_reader(client, url)) == b"hello"
+    assert _read(stream_cache.open_reader(client, url, encoding="utf-8")) == "hello"
+
+    assert client.downloads == 1
+    assert stream_cache.stats() == cache.CacheStats(hits=1, misses=1)
+
+
+def test_changed_resource(stream_cache):
+    client = FingerprintRecorder(b"hello")
+    url = URL("sftp://host/file.txt")
+    stream_cache.open_reader(client, url).close()
+
+    client.contents, client.fingerprint = b"world", "v2"
+    assert _read(stream_cache.open_reader(client, url)) == b"world"
+
+    assert client.downloads == 2
+    assert stream_cache.stats() == cache.CacheStats(hits=0, misses=2)
+
+
+def test_no_fingerprint(stream_cache):
+    client = FingerprintRecorder(b"hello", fingerprint=None)
+    url = URL("sftp://host/file.txt")
+
+    for _ in range(2):
+        assert _read(stream_cache.open_reader(client, url)) == b"hello"
+
+    assert client.downloads == 2
+
+
+def test_lru_eviction(stream_cache):
+    first, second, third = (URL(f"sftp://host/file_{i}.txt") for i in range(3))
+    stream_cache.open_reader(FingerprintRecorder(b"1111"), first).close()
+    stream_cache.open_reader(FingerprintRecorder(b"2222"), second).close()
+    stream_cache.open_reader(FingerprintRecorder(b"1111"), first).close()
+    # the cache can only fit two entries, the second url is the least recently used
+    stream_cache.open_reader(FingerprintRecorder(b"3333"), third).close()
+
+    client = FingerprintRecorder(b"1111")
+    stream_cache.open_reader(client, first).close()
+    assert client.downloads == 0
+    client = FingerprintRecorder(b"2222")
+    stream_cache.open_reader(client, second).close()
+    assert client.downloads == 1
+
+
+def test_clear(stream_cache):
+    client = FingerprintRecorder(b"hello")
+    url = URL("sftp://host/file.txt")
+    stream_cache.open_reader(client, url).close()
+
+    stream_cache.clear()
+    stream_cache.open_reader(client, url).close()
+
+    assert client.downloads == 2
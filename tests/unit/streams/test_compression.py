@@ -0,0 +1,177 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+
+import pytest
+
+from tentaclio import URL
+from tentaclio.clients import base_client
+from tentaclio.clients.local_fs_client import LocalFSClient
+from tentaclio.streams import StreamURLHandler, base_stream, compression, local_stream
+
+
+class FakeClient(base_client.BaseClient["FakeClient"]):
+    def __init__(self, url: URL, message: bytes = b"", *args, **kwargs):
+        self._writer = io.BytesIO()
+        self._message = message
+
+    def _connect(self):
+        return io.BytesIO()
+
+    def get(self, writer) -> None:
+        writer.write(self._message)
+
+    def put(self, reader, **params) -> None:
+        self._writer.write(reader.read())
+
+
+@pytest.mark.parametrize(
+    "path, compression_, expected",
+    [
+        ("/data.csv.gz", compression.INFER, "gzip"),
+        ("/data.csv.BZ2", compression.INFER, "bz2"),
+        ("/data.csv.xz", compression.INFER, "xz"),
+        ("/data.csv.zst", compression.INFER, "zstd"),
+        ("/data.csv", compression.INFER, None),
+        ("/data.csv", "gzip", "gzip"),
+        ("/data.csv.gz", None, None),
+    ],
+)
+def test_get_codec(path, compression_, expected):
+    codec = compression.get_codec(URL(f"sftp://host{path}"), compression_)
+    assert (codec and codec.name) == expected
+
+
+def test_get_codec_invalid():
+    with pytest.raises(ValueError):
+        compression.get_codec(URL("sftp://host/data.csv"), "snappy")
+
+
+@pytest.mark.parametrize(
+    "extension, decompress",
+    [(".gz", gzip.decompress), (".bz2", bz2.decompress), (".xz", lzma.decompress)],
+)
+@pytest.mark.parametrize("mode, message", [("b", b"hello"), ("t", "hello")])
+def test_compressed_writer(extension, decompress, mode, message):
+    url = URL(f"sftp://host/data.csv{extension}")
+    client = FakeClient(url)
+    writer = StreamURLHandler(lambda url, **kwargs: client).open_writer_for(
+        url, mode=mode, extras={"compression": "infer"}
+    )
+
+    writer.write(message)
+    writer.close()
+
+    assert decompress(client._writer.getvalue()) == b"hello"
+
+
+@pytest.mark.parametrize(
+    "extension, compress",
+    [(".gz", gzip.compress), (".bz2", bz2.compress), (".xz", lzma.compress)],
+)
+@pytest.mark.parametrize("mode, expected", [("b", b"hello\n"), ("t", "hello\n")])
+def test_compressed_reader(extension, compress, mode, expected):
+    url = URL(f"sftp://host/data.csv{extension}")
+    handler = StreamURLHandler(lambda url, **kwargs: FakeClient(url, compress(b"hello\n")))
+    reader = handler.open_reader_for(url, mode=mode, extras={"compression": "infer"})
+
+    assert reader.readline() == expected
+    reader.close()
+
+
+def test_streaming_compressed_reader():
+    class ChunkFakeClient(FakeClient):
+        def iter_chunks(self, chunk_size: int):
+            for start in range(0, len(self._message), chunk_size):
+                end = start + chunk_size
+                yield self._message[start:end]
+
+    url = URL("sftp://host/data.csv.gz")
+    handler = StreamURLHandler(lambda url, **kwargs: ChunkFakeClient(url, gzip.compress(b"hello")))
+    reader = handler.open_reader_for(
+        url, mode="b", extras={"streaming": True, "chunk_size": 2, "compression": "infer"}
+    )
+
+    assert not reader.seekable()
+    assert reader.read() == b"hello"
+
+
+@pytest.mark.parametrize("extras", [{}, {"compression": None}])
+def test_compression_disabled(extras):
+    url = URL("sftp://host/data.csv.gz")
+    client = FakeClient(url, b"raw")
+    handler = StreamURLHandler(lambda url, **kwargs: client)
+
+    assert handler.open_reader_for(url, mode="b", extras=extras).read() == b"raw"
+
+
+def test_dirty_compressed_writer_clean(tmp_path):
+    path = tmp_path / "data.csv.gz"
+    writer = base_stream.DirtyStreamerWriter(
+        compression.CompressingStreamerWriter(
+            local_stream.FileStreamerWriter(LocalFSClient(str(path))), compression.CODECS["gzip"]
+        )
+    )
+    writer.close()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_zstd_round_trip():
+    zstandard = pytest.importorskip("zstandard")
+    url = URL("sftp://host/data.csv.zst")
+    client = FakeClient(url)
+    writer = StreamURLHandler(lambda url, **kwargs: client).open_writer_for(
+        url, mode="b", extras={"compression": "infer"}
+    )
+    writer.write(b"hello")
+    writer.close()
+
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(
+        client._writer.getvalue()
+    ) == b"hello"
+
+
+@pytest.mark.parametrize(
+    "extension, decompress",
+    [(".gz", gzip.decompress), (".bz2", bz2.decompress), (".xz", lzma.decompress)],
+)
+def test_parallel_compressed_writer(extension, decompress):
+    url = URL(f"sftp://host/data.csv{extension}")
+    client = FakeClient(url)
+    writer = StreamURLHandler(lambda url, **kwargs: client).open_writer_for(
+        url, mode="t", extras={"compression": "infer", "compression_threads": 4, "chunk_size": 8}
+    )
+
+    lines = [f"line {i}\n" for i in range(100)]
+    for line in lines:
+        writer.write(line)
+    writer.close()
+
+    assert decompress(client._writer.getvalue()) == "".join(lines).encode()
+
+
+def test_parallel_compressed_writer_members():
+    destination = io.BytesIO()
+    compressor = compression._ParallelCompressor(
+        compression.CODECS["gzip"], destination, threads=2, block_size=4
+    )
+    compressor.write(b"0123456789")
+    compressor.close()
+
+    with gzip.GzipFile(fileobj=io.BytesIO(destination.getvalue())) as f:
+        assert f.read() == b"0123456789"
+    # one member per block
+    assert destination.getvalue().count(b"\x1f\x8b") == 3
+
+
+def test_parallel_compressed_writer_empty():
+    destination = io.BytesIO()
+    compressor = compression._ParallelCompressor(
+        compression.CODECS["gzip"], destination, threads=2, block_size=4
+    )
+    compressor.close()
+
+    assert gzip.decompress(destination.getvalue()) == b""
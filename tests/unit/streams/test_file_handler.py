@@ -1,3 +1,4 @@
+import gzip
 import io
 import os
 import tempfile
@@ -5,6 +6,7 @@ import tempfile
 import pytest
 
 from tentaclio import URL, api
+from tentaclio.streams import local_stream
 
 
 @pytest.fixture
@@ -42,6 +44,21 @@ def test_file_read_write(mode, expected, temp_filename):
     assert contents == expected
 
 
+def test_compressed_file_read_write(temp_filename):
+    filename = temp_filename + ".gz"
+    with api.open(filename, mode="w", compression="infer") as writer:
+        writer.write("hello file")
+
+    with gzip.open(filename) as f:
+        assert f.read() == b"hello file"
+    with api.open(filename, compression="infer") as reader:
+        assert reader.read() == "hello file"
+    # the contents are left compressed by default
+    with api.open(filename, mode="rb") as reader:
+        assert gzip.decompress(reader.read()) == b"hello file"
+    os.remove(filename)
+
+
 def test_expand_user(mocker):
     file_name = "~"
     mocked_open = mocker.patch("tentaclio.clients.local_fs_client.open")
@@ -50,3 +67,13 @@ def test_expand_user(mocker):
 
     api.open(file_name)
     mocked_open.assert_called_with(os.path.expanduser(file_name), "rb")
+
+
+@pytest.mark.parametrize("mode", ["", "b"])
+def test_file_reader_is_backed_by_os_file(mode, temp_filename):
+    with api.open(temp_filename, mode="w" + mode) as writer:
+        writer.write(b"hello" if mode else "hello")
+
+    with api.open(temp_filename, mode=mode) as reader:
+        assert isinstance(reader, local_stream.FileStreamerReader)
+        assert isinstance(reader.fileno(), int)
@@ -24,7 +24,8 @@ def test_handler_is_registered(url, scheme):
     ],
 )
 def test_open_http_url_reading(mode, content, expected_content, mocker):
-    mocked_response = mocker.Mock(content=content)
+    mocked_response = mocker.MagicMock()
+    mocked_response.iter_content.return_value = iter([content[:5], content[5:]])
     mocked_session_call = mocker.patch.object(
         requests.Session, "send", return_value=mocked_response
     )
@@ -0,0 +1,141 @@
+import io
+import os
+import stat
+
+import pytest
+
+import tentaclio
+from tentaclio.clients.local_fs_client import LocalFSClient
+from tentaclio.streams import base_stream, local_stream
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"hello\nworld")
+    return str(path)
+
+
+class TestFileStreamerReader:
+    def test_read(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file))
+
+        assert reader.readline() == b"hello\n"
+        assert reader.read() == b"world"
+
+    def test_read_text(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file), encoding="utf-8")
+
+        assert reader.read() == "hello\nworld"
+
+    def test_readinto(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file))
+        buff = bytearray(5)
+
+        assert reader.readinto(buff) == 5
+        assert buff == b"hello"
+
+    def test_readinto_text(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file), encoding="utf-8")
+
+        with pytest.raises(io.UnsupportedOperation):
+            reader.readinto(bytearray(5))
+
+    def test_fileno(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file))
+
+        assert isinstance(reader.fileno(), int)
+
+    def test_getbuffer(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file))
+
+        view = reader.getbuffer()
+        assert view.readonly
+        assert bytes(view[:5]) == b"hello"
+        assert reader.tell() == 0
+        del view
+        reader.close()
+        assert reader.buffer.closed
+
+    def test_getbuffer_empty(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        reader = local_stream.FileStreamerReader(LocalFSClient(str(path)))
+
+        assert bytes(reader.getbuffer()) == b""
+
+    def test_seek(self, local_file):
+        reader = local_stream.FileStreamerReader(LocalFSClient(local_file))
+        reader.seek(-5, io.SEEK_END)
+
+        assert reader.read() == b"world"
+
+
+class TestFileStreamerWriter:
+    def test_write(self, tmp_path):
+        path = tmp_path / "file.bin"
+
+        writer = local_stream.FileStreamerWriter(LocalFSClient(str(path)))
+        writer.write(b"hello")
+        assert not path.exists()
+        writer.close()
+
+        assert path.read_bytes() == b"hello"
+        assert os.listdir(tmp_path) == ["file.bin"]
+
+    def test_write_text(self, tmp_path):
+        path = tmp_path / "file.txt"
+
+        writer = local_stream.FileStreamerWriter(LocalFSClient(str(path)), encoding="utf-8")
+        writer.write("👋 🐙")
+        writer.close()
+
+        assert path.read_text(encoding="utf-8") == "👋 🐙"
+
+    def test_replace_atomically(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"old contents")
+        path.chmod(0o640)
+
+        writer = local_stream.FileStreamerWriter(LocalFSClient(str(path)))
+        writer.write(b"new contents")
+        assert path.read_bytes() == b"old contents"
+        writer.close()
+
+        assert path.read_bytes() == b"new contents"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_dirty_writer_clean(self, tmp_path):
+        path = tmp_path / "file.bin"
+
+        writer = base_stream.DirtyStreamerWriter(
+            local_stream.FileStreamerWriter(LocalFSClient(str(path)))
+        )
+        writer.close()
+
+        assert os.listdir(tmp_path) == []
+
+    def test_write_through_symlink(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"old contents")
+        link = tmp_path / "link.bin"
+        link.symlink_to(path)
+
+        writer = local_stream.FileStreamerWriter(LocalFSClient(str(link)))
+        writer.write(b"new contents")
+        writer.close()
+
+        assert link.is_symlink()
+        assert path.read_bytes() == b"new contents"
+
+    def test_discard(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"old contents")
+
+        with pytest.raises(ValueError):
+            with tentaclio.open(str(path), mode="wb") as writer:
+                writer.write(b"new contents")
+                raise ValueError("failed")
+
+        assert path.read_bytes() == b"old contents"
+        assert os.listdir(tmp_path) == ["file.bin"]
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+
+from tentaclio.streams import range_stream
+
+
+class RangeRecorder:
+    def __init__(self, contents: bytes):
+        self.contents = contents
+        self.requests: list = []
+        self.closed = True
+
+    def __enter__(self):
+        self.closed = False
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+    def get_size(self) -> int:
+        return len(self.contents)
+
+    def get_range(self, offset: int, length: int) -> bytes:
+        self.requests.append((offset, length))
+        end = offset + length
+        return self.contents[offset:end]
+
+
+CONTENTS = bytes(range(256)) * 4
+
+
+class TestRangeStreamerReader:
+    def test_read_footer(self):
+        client = RangeRecorder(CONTENTS)
+
+        reader = range_stream.RangeStreamerReader(client, block_size=16)
+        reader.seek(-8, io.SEEK_END)
+
+        assert reader.read() == CONTENTS[-8:]
+        assert client.requests == [(1008, 16)]
+
+    def test_read_sequential(self):
+        client = RangeRecorder(CONTENTS)
+
+        reader = range_stream.RangeStreamerReader(client, block_size=64)
+
+        assert reader.read() == CONTENTS
+
+    def test_seek_and_tell(self):
+        client = RangeRecorder(CONTENTS)
+
+        reader = range_stream.RangeStreamerReader(client, block_size=16)
+        reader.seek(100)
+        assert reader.read(4) == CONTENTS[100:104]
+        assert reader.tell() == 104
+        reader.seek(-4, io.SEEK_CUR)
+        assert reader.read(4) == CONTENTS[100:104]
+
+    def test_block_cache(self):
+        client = RangeRecorder(CONTENTS)
+
+        reader = range_stream.RangeStreamerReader(client, block_size=16, cache_blocks=2)
+        for offset in (0, 20, 2, 40, 20):
+            reader.seek(offset)
+            reader.raw.readinto(bytearray(2))
+
+        assert client.requests == [(0, 16), (16, 16), (32, 16), (16, 16)]
+
+    def test_read_text(self):
+        client = RangeRecorder("👋 🐙".encode("utf-8"))
+
+        reader = range_stream.RangeStreamerReader(client, block_size=2, encoding="utf-8")
+
+        assert reader.read() == "👋 🐙"
+
+    def test_close(self):
+        client = RangeRecorder(CONTENTS)
+
+        reader = range_stream.RangeStreamerReader(client)
+        assert not client.closed
+        reader.close()
+
+        assert client.closed
+        assert reader.buffer.closed
+
+    def test_negative_seek(self):
+        client = RangeRecorder(CONTENTS)
+
+        reader = range_stream.RangeStreamerReader(client)
+        with pytest.raises(ValueError):
+            reader.seek(-1)
@@ -5,7 +5,7 @@ import pytest
 
 from tentaclio import URL, Reader, Writer
 from tentaclio.clients import base_client
-from tentaclio.streams import StreamURLHandler
+from tentaclio.streams import StreamURLHandler, base_stream, buffers, range_stream
 
 
 class FakeClient(base_client.BaseClient["FakeClient"]):
@@ -83,4 +83,147 @@ def test_open_writer_with_encoding(mocker, extras, expected):
     handler.client_factory.return_value = mock_client
     mock_writer = mocker.patch("tentaclio.streams.base_stream.StringToBytesClientWriter")
     handler.open_writer_for(URL("scheme://my/path"), mode="t", extras=extras)
-    mock_writer.assert_called_with(mock_client, encoding=expected)
+    mock_writer.assert_called_once()
+    assert mock_writer.call_args.args == (mock_client,)
+    assert mock_writer.call_args.kwargs["encoding"] == expected
+
+
+class ChunkFakeClient(FakeClient):
+    def iter_chunks(self, chunk_size: int):
+        message = self._message
+        for start in range(0, len(message), chunk_size):
+            end = start + chunk_size
+            yield message[start:end]
+
+
+@pytest.mark.parametrize("mode, expected", [("b", b"hello"), ("t", "hello")])
+def test_open_streaming_reader(mode, expected):
+    handler = StreamURLHandler(ChunkFakeClient)
+    reader = handler.open_reader_for(
+        URL("scheme://my/path"), mode=mode, extras={"streaming": True, "chunk_size": 2}
+    )
+    assert isinstance(reader, base_stream.ChunkedStreamerReader)
+    assert reader.read() == expected
+
+
+def test_open_streaming_reader_fallback():
+    handler = StreamURLHandler(FakeClient)
+    reader = handler.open_reader_for(URL("scheme://my/path"), mode="b", extras={"streaming": True})
+    assert not isinstance(reader, base_stream.ChunkedStreamerReader)
+    assert reader.read() == b"hello"
+
+
+@pytest.mark.parametrize("mode, message", [("b", b"hello"), ("t", "hello")])
+def test_open_streaming_writer(mode, message):
+    url = URL("scheme://my/path")
+    client = FakeClient(url)
+    handler = StreamURLHandler(lambda url, **kwargs: client)
+    writer = handler.open_writer_for(url, mode=mode, extras={"streaming": True, "chunk_size": 2})
+    assert isinstance(writer, base_stream.ChunkedStreamerWriter)
+
+    writer.write(message)
+    writer.close()
+
+    assert client._writer.getvalue() == b"hello"
+
+
+class RangeFakeClient(FakeClient):
+    def get_size(self) -> int:
+        return len(self._message)
+
+    def get_range(self, offset: int, length: int) -> bytes:
+        end = offset + length
+        return bytes(self._message[offset:end])
+
+
+def test_open_random_access_reader():
+    handler = StreamURLHandler(RangeFakeClient)
+    reader = handler.open_reader_for(
+        URL("scheme://my/path"), mode="b", extras={"random_access": True, "chunk_size": 2}
+    )
+    assert isinstance(reader, range_stream.RangeStreamerReader)
+    reader.seek(-3, io.SEEK_END)
+    assert reader.read() == b"llo"
+
+
+def test_open_random_access_reader_fallback():
+    handler = StreamURLHandler(FakeClient)
+    reader = handler.open_reader_for(
+        URL("scheme://my/path"), mode="b", extras={"random_access": True}
+    )
+    assert not isinstance(reader, range_stream.RangeStreamerReader)
+    assert reader.read() == b"hello"
+
+
+class FingerprintFakeClient(FakeClient):
+    def get_fingerprint(self) -> str:
+        return "v1"
+
+
+def test_open_cached_reader(mocker):
+    open_reader = mocker.patch("tentaclio.streams.cache.STREAM_CACHE.open_reader")
+    handler = StreamURLHandler(FingerprintFakeClient)
+    reader = handler.open_reader_for(URL("scheme://my/path"), mode="", extras={"cache": True})
+
+    assert reader == open_reader.return_value
+    assert open_reader.call_args.args[1] == URL("scheme://my/path")
+    assert open_reader.call_args.kwargs["encoding"] == "utf-8"
+
+
+def test_open_cached_reader_fallback(mocker):
+    open_reader = mocker.patch("tentaclio.streams.cache.STREAM_CACHE.open_reader")
+    handler = StreamURLHandler(FakeClient)
+    reader = handler.open_reader_for(URL("scheme://my/path"), mode="b", extras={"cache": True})
+
+    open_reader.assert_not_called()
+    assert reader.read() == b"hello"
+
+
+def test_stream_options_not_passed_to_client(mocker):
+    factory = mocker.MagicMock()
+    handler = StreamURLHandler(factory)
+    handler.open_writer_for(URL("scheme://my/path"), mode="b", extras={"streaming": True})
+    factory.assert_called_with(URL("scheme://my/path"))
+
+
+def test_open_writer_spill_threshold():
+    url = URL("scheme://my/path")
+    client = FakeClient(url)
+    handler = StreamURLHandler(lambda url, **kwargs: client)
+    writer = handler.open_writer_for(url, mode="b", extras={"spill_threshold": 2})
+
+    writer.write(b"hello")
+    assert writer.buffer.rolled
+    writer.close()
+
+    assert client._writer.getvalue() == b"hello"
+
+
+def test_open_text_writer_spill_threshold():
+    url = URL("scheme://my/path")
+    client = FakeClient(url)
+    handler = StreamURLHandler(lambda url, **kwargs: client)
+    writer = handler.open_writer_for(url, mode="t", extras={"spill_threshold": 2})
+    assert isinstance(writer, base_stream.StringToBytesClientWriter)
+
+    writer.write("hello")
+    writer.buffer.flush()
+    assert isinstance(writer.inner_buffer, buffers.SpooledBuffer)
+    assert writer.inner_buffer.rolled
+    writer.close()
+
+    assert client._writer.getvalue() == b"hello"
+
+
+def test_open_writer_spill_threshold_env(monkeypatch):
+    monkeypatch.setenv("TENTACLIO__SPILL_THRESHOLD", "2")
+    url = URL("scheme://my/path")
+    client = FakeClient(url)
+    handler = StreamURLHandler(lambda url, **kwargs: client)
+    writer = handler.open_writer_for(url, mode="b", extras={})
+
+    writer.write(b"hello")
+    assert writer.buffer.rolled
+    writer.close()
+
+    assert client._writer.getvalue() == b"hello"
@@ -0,0 +1,104 @@
+import asyncio
+import os
+
+import pytest
+
+import tentaclio
+from tentaclio import aio
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "file.txt")
+
+
+def test_aopen_context_manager(filename):
+    async def round_trip():
+        async with aio.aopen(filename, mode="w") as writer:
+            assert isinstance(writer, aio.AsyncStreamerWriter)
+            await writer.write("hello\n")
+            await writer.writelines(["world\n"])
+        async with aio.aopen(filename) as reader:
+            assert isinstance(reader, aio.AsyncStreamerReader)
+            return [line async for line in reader]
+
+    assert asyncio.run(round_trip()) == ["hello\n", "world\n"]
+
+
+def test_aopen_await(filename):
+    async def round_trip():
+        writer = await aio.aopen(filename, mode="wb")
+        await writer.write(b"hello")
+        await writer.close()
+        reader = await aio.aopen(filename, mode="rb")
+        await reader.seek(1)
+        contents = await reader.read()
+        await reader.close()
+        return contents, reader.closed
+
+    assert asyncio.run(round_trip()) == (b"ello", True)
+
+
+def test_awaited_writer_discard(filename):
+    async def failed_write():
+        writer = await aio.aopen(filename, mode="w")
+        async with writer:
+            await writer.write("partial")
+            raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(failed_write())
+
+    assert not os.path.exists(filename)
+
+
+def test_aopen_discard(filename):
+    async def failed_write():
+        async with aio.aopen(filename, mode="w") as writer:
+            await writer.write("partial")
+            raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(failed_write())
+
+    assert not os.path.exists(filename)
+    assert os.listdir(os.path.dirname(filename)) == []
+
+
+def test_concurrent_transfers(tmp_path):
+    names = [str(tmp_path / f"file_{i}.txt") for i in range(20)]
+
+    async def write(name):
+        async with aio.aopen(name, mode="w") as writer:
+            await writer.write(os.path.basename(name))
+
+    async def write_all():
+        await asyncio.gather(*(write(name) for name in names))
+
+    asyncio.run(write_all())
+    for name in names:
+        with tentaclio.open(name) as reader:
+            assert reader.read() == os.path.basename(name)
+
+
+def test_fs_operations(tmp_path):
+    source = str(tmp_path / "source.txt")
+    dest = str(tmp_path / "dest.txt")
+    with tentaclio.open(source, mode="w") as writer:
+        writer.write("hello")
+
+    async def operations():
+        await aio.acopy(source, dest)
+        await aio.aremove(source)
+        return await aio.ascandir(str(tmp_path))
+
+    entries = asyncio.run(operations())
+    assert [os.path.basename(str(entry.url)) for entry in entries] == ["dest.txt"]
+
+
+def test_configure_executor():
+    executor = aio.AsyncExecutor(max_workers=2)
+    assert asyncio.run(executor.run(sum, [1, 2])) == 3
+    executor.configure(max_workers=4)
+    assert asyncio.run(executor.run(sum, [1, 2, 3])) == 6
+    executor.shutdown()
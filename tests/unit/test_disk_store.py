@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from tentaclio import disk_store
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return disk_store.DiskStore(str(tmp_path / "store"), max_size=10)
+
+
+def test_write_data(store):
+    with store.write_data("key") as f:
+        f.write(b"old")
+    store.write_meta("key", "meta")
+
+    with store.write_data("key") as f:
+        f.write(b"hello")
+
+    with open(store.data_path("key"), "rb") as f:
+        assert f.read() == b"hello"
+    # the metadata described the previous contents
+    assert store.read_meta("key") is None
+
+
+def test_failed_write_data(store):
+    with store.write_data("key") as f:
+        f.write(b"hello")
+    store.write_meta("key", "meta")
+
+    with pytest.raises(ValueError):
+        with store.write_data("key") as f:
+            f.write(b"world")
+            raise ValueError("failed")
+
+    with open(store.data_path("key"), "rb") as f:
+        assert f.read() == b"hello"
+    assert store.read_meta("key") == "meta"
+    assert sorted(os.listdir(store.directory)) == ["key.data", "key.meta"]
+
+
+def test_evict(store):
+    for key in ("first", "second", "third"):
+        with store.write_data(key) as f:
+            f.write(b"1234")
+    os.utime(store.data_path("second"), (0, 0))
+    os.utime(store.data_path("first"), (1, 1))
+
+    store.evict(keep="second")
+
+    assert not store.touch("first")
+    assert store.touch("second")
+    assert store.touch("third")
+
+
+def test_clear(store):
+    with store.write_data("key") as f:
+        f.write(b"hello")
+    store.write_meta("key", "meta")
+
+    store.clear()
+
+    assert os.listdir(store.directory) == []